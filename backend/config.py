@@ -1,11 +1,13 @@
 import os
 
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
     """Application settings with environment variable support"""
     
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=False)
+    
     # API Keys
     groq_api_key: str = ""
     huggingface_api_key: str = ""
@@ -15,17 +17,14 @@ class Settings(BaseSettings):
     max_file_size: int = 10 * 1024 * 1024  # 10MB
     
     # Application
-    environment: str = "development"
+    # API docs (/docs, /redoc) are only served when ENVIRONMENT=development is set explicitly
+    environment: str = "production"
     debug: bool = True
     log_level: str = "INFO"
     
     # Server
     host: str = "0.0.0.0"
     port: int = int(os.getenv("PORT", "8000"))  # Render sets PORT dynamically
-    
-    class Config:
-        env_file = ".env"
-        case_sensitive = False
 
 
-settings = Settings()
\ No newline at end of file
+settings = Settings()
@@ -6,53 +6,194 @@ from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
+from slowapi.middleware import SlowAPIMiddleware
 import os
 import traceback
-import requests
 import logging
+import logging.handlers
+import queue
 from typing import Optional
-from dotenv import load_dotenv
 import asyncio
+import tempfile
+import time
+import hashlib
+import pickle
+from collections import OrderedDict
 from contextlib import asynccontextmanager
+from functools import lru_cache
 
-# Load environment variables
-load_dotenv()
+from config import settings
+from models.schemas import PDFGenerationRequest, PDFGenerationResponse
+
+# Configure logging - records are written directly until the app starts; while it runs,
+# request handlers only enqueue records and a background listener thread does the writes
+log_queue = queue.Queue(-1)
+log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+file_handler = logging.FileHandler('app.log')
+file_handler.setFormatter(log_formatter)
+stream_handler = logging.StreamHandler()
+stream_handler.setFormatter(log_formatter)
+direct_log_handlers = (file_handler, stream_handler)
+queue_log_handler = logging.handlers.QueueHandler(log_queue)
+log_listener = logging.handlers.QueueListener(log_queue, *direct_log_handlers)
 
-# Configure logging
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('app.log'),
-        logging.StreamHandler()
-    ]
+    handlers=list(direct_log_handlers)
 )
 logger = logging.getLogger(__name__)
 
-from models.schemas import PDFGenerationRequest, PDFGenerationResponse
-from services.github_analyzer_service import GitHubAnalyzerService
-from services.github_architecture_service import GitHubArchitectureService
-from services.github_pdf_service import GitHubPDFService
+
+def set_queued_logging(enabled: bool):
+    """Route root logging through the queue only while its listener is running"""
+    root_logger = logging.getLogger()
+    if enabled:
+        log_listener.start()
+        root_logger.addHandler(queue_log_handler)
+        for handler in direct_log_handlers:
+            root_logger.removeHandler(handler)
+    else:
+        for handler in direct_log_handlers:
+            root_logger.addHandler(handler)
+        root_logger.removeHandler(queue_log_handler)
+        # Drains whatever is still queued before returning
+        log_listener.stop()
+
+# Uploads are streamed to disk in 64KB chunks
+UPLOAD_CHUNK_SIZE = 64 * 1024
+MAX_UPLOAD_MB = settings.max_file_size // (1024 * 1024)
+
+# PRD uploads - content types that go through document text extraction
+DOCUMENT_CONTENT_TYPES = frozenset({
+    'application/pdf', 'application/msword', 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
+})
+DOCUMENT_EXTENSIONS = ('.pdf', '.doc', '.docx', '.ppt', '.pptx', '.xlsx', '.xls')
+ALLOWED_PRD_CONTENT_TYPES = DOCUMENT_CONTENT_TYPES | frozenset({
+    'text/plain', 'text/markdown', 'application/json'
+})
+# Browsers often send a generic type for .md/.pptx/.xlsx, so the extension also counts
+ALLOWED_PRD_EXTENSIONS = DOCUMENT_EXTENSIONS + ('.txt', '.md', '.rtf', '.json')
+MIN_PRD_TEXT_LENGTH = 10
+
+# Serializes PDF/diagram rendering now that it runs in worker threads
+pdf_render_lock = asyncio.Lock()
+
+# Repository analysis cache - repeat requests for the same repo skip the clone
+ANALYSIS_CACHE_TTL = 3600  # seconds
+ANALYSIS_CACHE_MAXSIZE = 64
+analysis_cache: OrderedDict = OrderedDict()
+# Disk layer behind the memory cache so restarts and other workers reuse analyses.
+# Entries are pickles, so they live in an app-owned directory next to generated_pdfs, never shared /tmp
+ANALYSIS_CACHE_DIR = "analysis_cache"
+# Analyses currently running, keyed like the cache (bounded by the rate limit)
+analysis_inflight: dict = {}
 
 # Initialize rate limiter
 limiter = Limiter(key_func=get_remote_address)
 
+
+def analysis_cache_key(github_link: str, github_token: str = "") -> str:
+    """Hash repo URL and token into a compact cache key (not a security boundary)"""
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(github_link.encode())
+    hasher.update(b'\0')
+    hasher.update(github_token.encode())
+    return hasher.hexdigest()
+
+
+def get_cached_analysis(key):
+    """Return cached (repo_analysis, architecture) for key, or None if missing/expired"""
+    entry = analysis_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, value = entry
+    if expires_at < time.monotonic():
+        del analysis_cache[key]
+        return None
+    analysis_cache.move_to_end(key)
+    return value
+
+
+def store_cached_analysis(key, value):
+    """Store value under key, evicting the least recently used entry when full"""
+    analysis_cache[key] = (time.monotonic() + ANALYSIS_CACHE_TTL, value)
+    analysis_cache.move_to_end(key)
+    while len(analysis_cache) > ANALYSIS_CACHE_MAXSIZE:
+        analysis_cache.popitem(last=False)
+
+
+def analysis_cache_dir_is_private() -> bool:
+    """True if the cache directory belongs to this user and no one else can write into it"""
+    try:
+        st = os.stat(ANALYSIS_CACHE_DIR)
+    except FileNotFoundError:
+        return False
+    return st.st_uid == os.getuid() and not st.st_mode & 0o077
+
+
+def load_disk_analysis(key):
+    """Return the on-disk (repo_analysis, architecture) for key, or None if missing/stale"""
+    path = os.path.join(ANALYSIS_CACHE_DIR, f"{key}.pickle")
+    # Unpickling runs code, so only read entries nobody else could have planted
+    if not analysis_cache_dir_is_private():
+        return None
+    try:
+        if time.time() - os.path.getmtime(path) > ANALYSIS_CACHE_TTL:
+            os.unlink(path)
+            return None
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Discarding unreadable analysis cache entry {key}: {str(e)}")
+        return None
+
+
+def store_disk_analysis(key, value):
+    """Write value for key atomically so readers never see a partial file"""
+    try:
+        os.makedirs(ANALYSIS_CACHE_DIR, mode=0o700, exist_ok=True)
+        if not analysis_cache_dir_is_private():
+            logger.warning(f"Not persisting analysis cache: {ANALYSIS_CACHE_DIR} is not private to this user")
+            return
+        fd, tmp_path = tempfile.mkstemp(dir=ANALYSIS_CACHE_DIR, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, os.path.join(ANALYSIS_CACHE_DIR, f"{key}.pickle"))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except Exception as e:
+        logger.warning(f"Could not persist analysis cache entry {key}: {str(e)}")
+
+
+@lru_cache(maxsize=1)
+def get_architecture_service():
+    """Shared GitHubArchitectureService - it holds no per-request state"""
+    # Imported on first use to keep GitPython out of startup
+    from services.github_architecture_service import GitHubArchitectureService
+    return GitHubArchitectureService()
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
+    set_queued_logging(True)
     logger.info("Starting System Architecture Agent API...")
     os.makedirs("generated_pdfs", exist_ok=True)
     yield
     # Shutdown
     logger.info("Shutting down System Architecture Agent API...")
+    set_queued_logging(False)
 
 # Initialize FastAPI app
 app = FastAPI(
     title="System Architecture Agent API",
     description="API for generating system architecture PDFs from GitHub repositories",
     version="1.0.0",
-    docs_url="/docs" if os.getenv('ENVIRONMENT') == 'development' else None,
-    redoc_url="/redoc" if os.getenv('ENVIRONMENT') == 'development' else None,
+    docs_url="/docs" if settings.environment == 'development' else None,
+    redoc_url="/redoc" if settings.environment == 'development' else None,
     lifespan=lifespan
 )
 
@@ -60,14 +201,13 @@ app = FastAPI(
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
-# Add security middleware
-app.add_middleware(
-    TrustedHostMiddleware, 
-    allowed_hosts=["localhost", "127.0.0.1", "*.onrender.com", "*.yourdomain.com"]
-)
+# Middleware runs in reverse order of registration (last added is outermost).
+# SlowAPIMiddleware is added first so it is innermost and only counts requests that
+# passed the host and CORS checks; TrustedHost wraps everything and rejects bad hosts first.
+app.add_middleware(SlowAPIMiddleware)
 
 # Configure CORS for production
-allowed_origins = os.getenv('ALLOWED_ORIGINS', 'http://localhost:3000,http://127.0.0.1:3000').split(',')
+allowed_origins = settings.allowed_origins.split(',')
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],  # Allow all origins for development
@@ -76,6 +216,12 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Add security middleware (outermost)
+app.add_middleware(
+    TrustedHostMiddleware, 
+    allowed_hosts=["localhost", "127.0.0.1", "*.onrender.com", "*.yourdomain.com"]
+)
+
 # Initialize services - only GitHub services needed
 
 # Mount static files for PDF downloads
@@ -103,8 +249,8 @@ async def health_check(request: Request):
     """Comprehensive health check endpoint"""
     try:
         # Check API keys
-        groq_key = os.getenv('GROQ_API_KEY')
-        hf_key = os.getenv('HUGGINGFACE_API_KEY')
+        groq_key = settings.groq_api_key
+        hf_key = settings.huggingface_api_key
         
         # Check file system
         pdf_dir_exists = os.path.exists("generated_pdfs")
@@ -113,7 +259,7 @@ async def health_check(request: Request):
             "status": "healthy",
             "service": "System Architecture Agent API",
             "version": "1.0.0",
-            "environment": os.getenv('ENVIRONMENT', 'development'),
+            "environment": settings.environment,
             "checks": {
                 "groq_api_configured": bool(groq_key),
                 "huggingface_api_configured": bool(hf_key),
@@ -146,6 +292,10 @@ async def generate_github_architecture(
     prd_document: Optional[UploadFile] = File(None)
 ):
     """Generate comprehensive system architecture PDF from GitHub repository and optional PRD"""
+    # Service modules pull in GitPython, ReportLab and matplotlib - import them on
+    # first use so health checks and downloads don't pay for it at startup
+    from services.github_pdf_service import GitHubPDFService
+    
     client_ip = get_remote_address(request)
     logger.info(f"GitHub architecture generation request from {client_ip} for repo: {github_link[:50]}...")
     
@@ -160,92 +310,163 @@ async def generate_github_architecture(
         # Process PRD document if provided
         prd_content = None
         if prd_document:
-            # Security validations
-            if prd_document.size > 10 * 1024 * 1024:  # 10MB limit
+            # Security validations - reject early when the client reported a size
+            if prd_document.size and prd_document.size > settings.max_file_size:
                 raise HTTPException(
                     status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                    detail="PRD file size exceeds 10MB limit"
+                    detail=f"PRD file size exceeds {MAX_UPLOAD_MB}MB limit"
                 )
             
-            allowed_types = {
-                'application/pdf', 'application/msword', 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
-                'text/plain', 'text/markdown', 'application/json'
-            }
+            prd_filename = (prd_document.filename or '').lower()
+            is_document = (prd_document.content_type in DOCUMENT_CONTENT_TYPES or
+                           prd_filename.endswith(DOCUMENT_EXTENSIONS))
             
-            if prd_document.content_type not in allowed_types:
+            # Reject unsupported files before reading any of the body
+            if (prd_document.content_type not in ALLOWED_PRD_CONTENT_TYPES and
+                    not prd_filename.endswith(ALLOWED_PRD_EXTENSIONS)):
                 logger.warning(f"Unsupported PRD file type: {prd_document.content_type}")
+                raise HTTPException(
+                    status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+                    detail="Unsupported PRD file type. Please upload a PDF, Word, PowerPoint, Excel, text or markdown file."
+                )
             
+            temp_file_path = None
             try:
-                file_content = await prd_document.read()
+                # Stream the upload to disk in chunks so memory stays flat and the
+                # size limit is enforced before the whole body has been read
+                file_extension = os.path.splitext(prd_document.filename or '')[1] or '.tmp'
+                total_bytes = 0
+                with tempfile.NamedTemporaryFile(suffix=file_extension, delete=False) as temp_file:
+                    temp_file_path = temp_file.name
+                    while chunk := await prd_document.read(UPLOAD_CHUNK_SIZE):
+                        total_bytes += len(chunk)
+                        if total_bytes > settings.max_file_size:
+                            raise HTTPException(
+                                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                                detail=f"PRD file size exceeds {MAX_UPLOAD_MB}MB limit"
+                            )
+                        temp_file.write(chunk)
+                
                 # Don't decode here - let the document extractor handle it
                 prd_content = None  # Will be set by document extraction
-                logger.info(f"📝 PRD document received: {prd_document.filename} ({len(file_content)} bytes)")
+                logger.info(f"📝 PRD document received: {prd_document.filename} ({total_bytes} bytes)")
                 
                 # Handle all document types using GitHubPDFService
-                if (prd_document.content_type in ['application/pdf', 'application/msword', 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'] or 
-                    prd_document.filename.lower().endswith(('.pdf', '.doc', '.docx', '.ppt', '.pptx', '.xlsx', '.xls'))):
+                if is_document:
                     logger.info(f"📝 Document file detected: {prd_document.filename}, attempting text extraction...")
                     try:
                         github_pdf_service = GitHubPDFService()
-                        # Save the file temporarily for extraction
-                        import tempfile
-                        file_extension = os.path.splitext(prd_document.filename)[1] or '.tmp'
-                        with tempfile.NamedTemporaryFile(suffix=file_extension, delete=False) as temp_file:
-                            temp_file.write(file_content)
-                            temp_file_path = temp_file.name
                         
                         # Extract text using universal document reader
-                        extracted_text = github_pdf_service.extract_text_from_file(temp_file_path)
-                        if extracted_text and len(extracted_text.strip()) > 10:
+                        extracted_text = await asyncio.to_thread(
+                            github_pdf_service.extract_text_from_file, temp_file_path
+                        )
+                        if extracted_text and len(extracted_text.strip()) > MIN_PRD_TEXT_LENGTH:
                             prd_content = extracted_text
                             logger.info(f"✅ Document text extraction successful: {len(prd_content)} characters")
                         else:
                             logger.warning("⚠️ Document extraction yielded minimal content, using decoded fallback")
-                        
-                        # Clean up temp file
-                        os.unlink(temp_file_path)
                     except Exception as doc_e:
                         logger.warning(f"⚠️ Document text extraction failed: {str(doc_e)}, using decoded content")
                 
+            except HTTPException:
+                raise
             except Exception as e:
                 logger.error(f"Error processing PRD document: {str(e)}")
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail="Could not process PRD document. Please ensure it's a valid text file."
                 )
+            finally:
+                # Clean up temp file
+                if temp_file_path and os.path.exists(temp_file_path):
+                    os.unlink(temp_file_path)
         
-        # Initialize GitHub architecture service
+        # Reuse the cached GitHub architecture service
         logger.info("🔍 Initializing GitHub architecture analysis...")
-        github_arch_service = GitHubArchitectureService()
+        github_arch_service = get_architecture_service()
+        github_pdf_service = GitHubPDFService(output_dir="generated_pdfs")
         
-        # Generate comprehensive architecture
-        logger.info("📊 Analyzing repository and generating architecture...")
-        try:
-            print(f"🔍 Starting analysis for: {github_link}")
-            print(f"🔑 Token provided: {bool(github_token)}")
-            print(f"📄 PRD provided: {bool(prd_content)}")
+        # Key on the token too so private repo results are never served without it
+        cache_key = analysis_cache_key(github_link, github_token)
+        
+        async def run_analysis():
+            cached = await asyncio.to_thread(load_disk_analysis, cache_key)
+            if cached is not None:
+                logger.info(f"💾 Using disk-cached repository analysis for: {github_link[:50]}")
+                store_cached_analysis(cache_key, cached)
+                return cached
             
             # Get repository analysis for AI-powered diagrams
-            repo_analysis = github_arch_service.github_analyzer.analyze_repository(
+            # Cloning and analysis block, so run them off the event loop
+            repo_analysis = await asyncio.to_thread(
+                github_arch_service.github_analyzer.analyze_repository,
                 github_link, 
                 github_token if github_token else None
             )
             
-            architecture = github_arch_service.generate_architecture_from_github(
+            # Reuse the analysis above instead of cloning the repository a second time
+            architecture = await asyncio.to_thread(
+                github_arch_service.generate_architecture_from_github,
                 github_url=github_link,
                 github_token=github_token if github_token else None,
-                prd_content=prd_content
+                prd_content=prd_content,
+                repo_analysis=repo_analysis
             )
+            store_cached_analysis(cache_key, (repo_analysis, architecture))
+            await asyncio.to_thread(store_disk_analysis, cache_key, (repo_analysis, architecture))
+            return repo_analysis, architecture
+        
+        async def analyze_repository():
+            cached = get_cached_analysis(cache_key)
+            if cached is not None:
+                logger.info(f"♻️ Using cached repository analysis for: {github_link[:50]}")
+                return cached
+            
+            # Identical concurrent requests share one clone/analysis
+            task = analysis_inflight.get(cache_key)
+            if task is None:
+                task = asyncio.ensure_future(run_analysis())
+                analysis_inflight[cache_key] = task
+                task.add_done_callback(lambda _: analysis_inflight.pop(cache_key, None))
+            else:
+                logger.info(f"⏳ Joining in-flight analysis for: {github_link[:50]}")
             
-            print(f"✅ Architecture generated successfully")
-            print(f"📊 API Endpoints: {architecture.api_documentation.get('total_endpoints', 0)}")
+            # Shield so one client disconnecting doesn't cancel the analysis for the others
+            return await asyncio.shield(task)
+        
+        async def parse_prd():
+            # PRD parsing only needs the text, so it overlaps with the clone
+            if not prd_content:
+                return None
+            try:
+                return await asyncio.to_thread(github_pdf_service.parse_prd_content, prd_content)
+            except Exception as e:
+                # The PDF service parses the raw content itself when this is missing
+                logger.warning(f"⚠️ PRD parsing failed, deferring to PDF generation: {str(e)}")
+                return None
+        
+        # Generate comprehensive architecture
+        logger.info("📊 Analyzing repository and generating architecture...")
+        try:
+            logger.info(f"🔍 Starting analysis for: {github_link}")
+            logger.info(f"🔑 Token provided: {bool(github_token)}")
+            logger.info(f"📄 PRD provided: {bool(prd_content)}")
+            
+            (repo_analysis, architecture), prd_analysis = await asyncio.gather(
+                analyze_repository(),
+                parse_prd()
+            )
+            
+            logger.info("✅ Architecture generated successfully")
+            logger.info(f"📊 API Endpoints: {architecture.api_documentation.get('total_endpoints', 0)}")
             components_count = architecture.frontend_architecture.get('components', {}).get('total_components', 0)
             services_count = architecture.backend_architecture.get('services', {}).get('total_services', 0)
             languages_count = len(architecture.tech_stack_summary.get('languages', []))
             
-            print(f"🏗️ Components: {components_count}")
-            print(f"🔧 Services: {services_count}")
-            print(f"💻 Languages: {languages_count}")
+            logger.info(f"🏗️ Components: {components_count}")
+            logger.info(f"🔧 Services: {services_count}")
+            logger.info(f"💻 Languages: {languages_count}")
         except Exception as e:
             error_msg = str(e)
             if "Repository cloning failed" in error_msg:
@@ -271,25 +492,24 @@ async def generate_github_architecture(
             logger.info(f"📝 PRD content length: {len(prd_content)} characters")
             logger.info(f"📝 PRD content sample: {prd_content[:300]}...")
         
-        github_pdf_service = GitHubPDFService(output_dir="generated_pdfs")
-        
         try:
-            # Parse PRD content to extract product name and other details
-            prd_analysis = None
-            if prd_content:
-                # Parse PRD content to extract structured information including product name
-                prd_analysis = github_pdf_service.parse_prd_content(prd_content)
+            # PRD content was parsed alongside the repository analysis
+            if prd_analysis:
                 logger.info(f"📝 PRD parsed - Product: {prd_analysis.get('product_name', 'Unknown')}")
                 logger.info(f"📝 PRD features: {len(prd_analysis.get('features', []))}")
                 logger.info(f"📝 PRD API endpoints: {len(prd_analysis.get('api_endpoints', []))}")
             
-            pdf_path = github_pdf_service.generate_architecture_pdf(
-                architecture=architecture,
-                github_url=github_link,
-                prd_included=prd_content is not None,
-                repo_analysis=repo_analysis,
-                prd_content=prd_content  # Pass original content for internal parsing
-            )
+            # pyplot keeps global figure state, so render one PDF at a time in the worker thread
+            async with pdf_render_lock:
+                pdf_path = await asyncio.to_thread(
+                    github_pdf_service.generate_architecture_pdf,
+                    architecture=architecture,
+                    github_url=github_link,
+                    prd_included=prd_content is not None,
+                    repo_analysis=repo_analysis,
+                    prd_content=prd_content,  # Pass original content for internal parsing
+                    prd_analysis=prd_analysis
+                )
         except Exception as e:
             logger.error(f"PDF generation failed: {str(e)}")
             logger.error(f"Full traceback: {traceback.format_exc()}")
@@ -358,30 +578,38 @@ async def download_pdf(filename: str):
     """
     file_path = os.path.join("generated_pdfs", filename)
     
-    if not os.path.exists(file_path):
+    # One stat call both checks existence and feeds FileResponse's size/ETag headers
+    try:
+        file_stat = os.stat(file_path)
+    except FileNotFoundError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="PDF file not found"
         )
     
+    # Generated reports are never rewritten under the same name, so let browsers keep them
     return FileResponse(
         path=file_path,
         media_type="application/pdf",
-        filename=filename
+        filename=filename,
+        stat_result=file_stat,
+        headers={"Cache-Control": "public, max-age=31536000, immutable"}
     )
 
 
 if __name__ == "__main__":
     import uvicorn
-    from config import settings
     
-    # Production-ready server configuration
+    # Production-ready server configuration - uvloop/httptools ship with uvicorn[standard].
+    # In production prefer the gunicorn + UvicornWorker start command from render.yaml.
     uvicorn.run(
         "main:app",
         host=settings.host,
         port=settings.port,
         reload=settings.debug,
         log_level=settings.log_level.lower(),
-        access_log=True,
+        loop="auto" if settings.debug else "uvloop",
+        http="auto" if settings.debug else "httptools",
+        access_log=settings.debug,  # requests are already logged by the app logger
         workers=1 if settings.debug else 4
     )
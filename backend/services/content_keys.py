@@ -0,0 +1,24 @@
+import hashlib
+import json
+from dataclasses import asdict, is_dataclass
+from typing import Any
+
+
+def _canonical_default(value: Any):
+    """JSON fallback for values json can't encode, independent of hash seed and object identity"""
+    if isinstance(value, (set, frozenset)):
+        # Set iteration order depends on PYTHONHASHSEED - order members by their own encoding
+        return sorted(value, key=canonical_json)
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    return str(value)
+
+
+def canonical_json(value: Any) -> str:
+    """Serialize value so equal content gives the same text in every process"""
+    return json.dumps(value, sort_keys=True, default=_canonical_default, ensure_ascii=False, separators=(',', ':'))
+
+
+def content_digest(*parts: Any, digest_size: int = 16) -> str:
+    """Hex BLAKE2b digest of the canonical serialization of parts"""
+    return hashlib.blake2b(canonical_json(parts).encode('utf-8'), digest_size=digest_size).hexdigest()
@@ -2,15 +2,36 @@ import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 from matplotlib.patches import FancyBboxPatch, ConnectionPatch
 import os
-import time
+from itertools import islice
 from typing import Dict, List, Any
 
+from .content_keys import content_digest
+
+
+def diagram_path(output_dir: str, prefix: str, *inputs) -> str:
+    """PNG path named by a hash of the diagram's inputs, so identical diagrams are rendered once and shared across reports"""
+    # Canonical JSON rather than repr - repr of set-derived values changes with each process's hash seed
+    key = content_digest(*inputs, digest_size=8)
+    return os.path.join(output_dir, f"{prefix}_{key}.png")
+
+
+def save_diagram(filepath: str, facecolor: str):
+    """Save the current figure under a temporary name and rename it, so a cached PNG is never half-written"""
+    tmp_path = f"{filepath}.{os.getpid()}.tmp"
+    plt.savefig(tmp_path, format='png', dpi=300, bbox_inches='tight', facecolor=facecolor, edgecolor='none')
+    plt.close()
+    os.replace(tmp_path, filepath)
+
+
 class ArchitectureDiagramGenerator:
     def __init__(self, output_dir: str):
         self.output_dir = output_dir
         
     def generate_system_architecture_diagram(self, repo_analysis: Dict, prd_analysis: Dict, endpoints: List[Dict]) -> str:
         """Generate clean professional 5-column system architecture diagram"""
+        filepath = diagram_path(self.output_dir, 'system_architecture', repo_analysis, prd_analysis, endpoints)
+        if os.path.exists(filepath):
+            return filepath
         
         # Create figure with professional dimensions
         fig, ax = plt.subplots(1, 1, figsize=(20, 12))
@@ -49,24 +70,22 @@ class ArchitectureDiagramGenerator:
         self._draw_left_to_right_flow(ax)
         
         # Save diagram
-        filename = f"system_architecture_{product_name.replace(' ', '_')}.png"
-        filepath = os.path.join(self.output_dir, filename)
-        plt.savefig(filepath, dpi=300, bbox_inches='tight', facecolor='white', edgecolor='none')
-        plt.close()
+        save_diagram(filepath, facecolor='white')
         
         return filepath
     
     def _extract_entities_from_endpoints(self, endpoints: List[Dict]) -> List[str]:
         """Extract unique entities from API endpoints"""
-        entities = set()
+        # Dict keys keep first-seen order, so the same endpoints always pick the same entities
+        entities = {}
         for ep in endpoints:
             if isinstance(ep, dict):
                 path = ep.get('path', '')
                 parts = [p for p in path.split('/') if p and p != 'api']
                 for part in parts:
                     if part not in ['auth', 'login', 'register', 'health']:
-                        entities.add(part.lower())
-        return list(entities)[:5]  # Limit to 5 main entities
+                        entities[part.lower()] = None
+        return list(islice(entities, 5))  # Limit to 5 main entities
     
     def _extract_backend_services_from_endpoints(self, endpoints: List[Dict]) -> List[str]:
         """Extract backend services from API endpoints"""
@@ -220,6 +239,9 @@ class ArchitectureDiagramGenerator:
 
     def generate_sequence_diagram(self, project_name: str, entity_name: str, endpoints: List[Dict]) -> str:
         """Generate a truly dynamic sequence diagram based on actual detected endpoints"""
+        filepath = diagram_path(self.output_dir, 'sequence_diagram', project_name, entity_name, endpoints)
+        if os.path.exists(filepath):
+            return filepath
         
         # Setup figure
         fig, ax = plt.subplots(1, 1, figsize=(14, 18))
@@ -301,10 +323,7 @@ class ArchitectureDiagramGenerator:
             step_number += 1
 
         # Save diagram
-        filename = f"sequence_diagram_{entity_display.lower()}_{int(time.time())}.png"
-        filepath = os.path.join(self.output_dir, filename)
-        plt.savefig(filepath, dpi=300, bbox_inches='tight', facecolor='white', edgecolor='none')
-        plt.close()
+        save_diagram(filepath, facecolor='white')
         
         return filepath
     
@@ -427,6 +446,9 @@ class ArchitectureDiagramGenerator:
 
     def generate_context_flow_diagram(self, frontend_tech: list, backend_tech: list, database_tech: list) -> str:
         """Generate visual context flow diagram (Client -> Frontend -> Backend -> Database)"""
+        filepath = diagram_path(self.output_dir, 'context_flow_diagram', frontend_tech, backend_tech, database_tech)
+        if os.path.exists(filepath):
+            return filepath
         
         fig, ax = plt.subplots(1, 1, figsize=(14, 10))
         ax.set_xlim(0, 20)
@@ -482,15 +504,15 @@ class ArchitectureDiagramGenerator:
                        bbox=dict(boxstyle='round,pad=0.3', facecolor='white', edgecolor='none', alpha=0.9))
         
         # Save
-        filename = f"context_flow_diagram_{int(time.time())}.png"
-        filepath = os.path.join(self.output_dir, filename)
-        plt.savefig(filepath, dpi=300, bbox_inches='tight', facecolor='white', edgecolor='none')
-        plt.close()
+        save_diagram(filepath, facecolor='white')
         
         return filepath
 
     def generate_frontend_architecture_diagram(self, frontend_tech: list, components_count: int, component_names: list) -> str:
         """Generate visual frontend architecture diagram"""
+        filepath = diagram_path(self.output_dir, 'frontend_architecture', frontend_tech, components_count, component_names)
+        if os.path.exists(filepath):
+            return filepath
         
         fig, ax = plt.subplots(1, 1, figsize=(14, 12))
         ax.set_xlim(0, 20)
@@ -563,15 +585,15 @@ class ArchitectureDiagramGenerator:
                bbox=dict(boxstyle='round,pad=0.3', facecolor='white', edgecolor='#2ecc71'))
         
         # Save
-        filename = f"frontend_architecture_{int(time.time())}.png"
-        filepath = os.path.join(self.output_dir, filename)
-        plt.savefig(filepath, dpi=300, bbox_inches='tight', facecolor='#f8f9fa', edgecolor='none')
-        plt.close()
+        save_diagram(filepath, facecolor='#f8f9fa')
         
         return filepath
 
     def generate_backend_architecture_diagram(self, backend_tech: list, api_count: int, database_tech: list) -> str:
         """Generate visual backend architecture diagram"""
+        filepath = diagram_path(self.output_dir, 'backend_architecture', backend_tech, api_count, database_tech)
+        if os.path.exists(filepath):
+            return filepath
         
         fig, ax = plt.subplots(1, 1, figsize=(14, 12))
         ax.set_xlim(0, 20)
@@ -636,9 +658,6 @@ class ArchitectureDiagramGenerator:
                bbox=dict(boxstyle='round,pad=0.3', facecolor='white', edgecolor='#9b59b6'))
         
         # Save
-        filename = f"backend_architecture_{int(time.time())}.png"
-        filepath = os.path.join(self.output_dir, filename)
-        plt.savefig(filepath, dpi=300, bbox_inches='tight', facecolor='#fafafa', edgecolor='none')
-        plt.close()
+        save_diagram(filepath, facecolor='#fafafa')
         
         return filepath
\ No newline at end of file
@@ -1,24 +1,148 @@
 import os
+import random
+import time
+import threading
+import hashlib
 try:
     import git
 except ImportError:
     raise ImportError("GitPython is required. Install with: pip install gitpython")
 import json
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 import re
 import ast
 import tempfile
 import shutil
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from collections import OrderedDict
+from itertools import islice
 from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 import logging
-from dataclasses import dataclass, asdict
-from dotenv import load_dotenv
+from dataclasses import dataclass, asdict, replace
 
-# Load environment variables
-load_dotenv()
+from config import settings
 
 logger = logging.getLogger(__name__)
 
+# Directories no extractor looks inside - pruned once in the shared repository walk
+ALWAYS_SKIPPED_DIRS = frozenset({'node_modules', '__pycache__', '.git'})
+
+# Clone retries for rate limiting / flaky networks - permanent errors still fail fast
+CLONE_MAX_ATTEMPTS = 3
+# Matched against git's own wording - the error text also carries the URL and temp path,
+# so bare status digits would match repo names and turn 404s/auth errors into retries
+TRANSIENT_CLONE_ERROR_RE = re.compile(
+    r'returned error: (?:429|5\d\d)|RPC failed; (?:HTTP (?:429|5\d\d)|curl)'
+    r'|Connection timed out|Operation timed out|Could not resolve host|Connection reset by peer'
+    r'|early EOF|unexpected disconnect|remote end hung up unexpectedly'
+)
+
+# Captures the body of a ```json / ``` fenced LLM response
+_FENCE_RE = re.compile(r'^\s*```(?:[a-zA-Z]+)?[ \t]*\n?(.*?)\n?```\s*$', re.DOTALL)
+
+# LLM enhancement is optional, so a slow Groq call must not hold up the report
+LLM_ENHANCEMENT_TIMEOUT = 15  # seconds
+LLM_ENHANCEMENT_WORKERS = 2
+_llm_executor = ThreadPoolExecutor(max_workers=LLM_ENHANCEMENT_WORKERS, thread_name_prefix="llm-enhance")
+# A timed-out call keeps its worker until the client returns; never queue work behind stuck workers
+_llm_slots = threading.BoundedSemaphore(LLM_ENHANCEMENT_WORKERS)
+
+# Completions keyed by prompt digest - identical repositories produce identical prompts
+LLM_CACHE_MAXSIZE = 256
+_llm_completion_cache: OrderedDict = OrderedDict()
+_llm_cache_lock = threading.Lock()
+
+# Threads used to read and scan source files for endpoints
+FILE_SCAN_WORKERS = min(8, (os.cpu_count() or 1) * 2)
+
+
+def _strip_fences(text: str) -> str:
+    """Return the body of a fenced LLM response, or the stripped text if it has no fence"""
+    match = _FENCE_RE.match(text)
+    return match.group(1) if match else text.strip()
+
+
+class CircuitBreaker:
+    """Fail fast after repeated failures, letting one trial call through every reset_time seconds"""
+    
+    def __init__(self, name: str, threshold: int = 5, reset_time: float = 30.0):
+        self.name = name
+        self.threshold = threshold
+        self.reset_time = reset_time
+        self._failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+    
+    def allow(self) -> bool:
+        """Return False while open; after the cool-down, admit a single trial call"""
+        with self._lock:
+            if self._failures < self.threshold:
+                return True
+            now = time.monotonic()
+            if now - self._opened_at >= self.reset_time:
+                # Half-open: restart the cool-down so concurrent callers keep failing fast
+                self._opened_at = now
+                return True
+            return False
+    
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+    
+    def trip(self):
+        """Open immediately, e.g. when the last call is still hanging past its deadline"""
+        with self._lock:
+            if self._failures < self.threshold:
+                logger.warning(f"{self.name} circuit opened")
+            self._failures = max(self._failures, self.threshold)
+            self._opened_at = time.monotonic()
+    
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.threshold:
+                if self._failures == self.threshold:
+                    logger.warning(f"{self.name} circuit opened after {self.threshold} consecutive failures")
+                self._opened_at = time.monotonic()
+
+
+# Shared across requests so an outage is detected once, not per analysis
+clone_breaker = CircuitBreaker("GitHub clone")
+llm_breaker = CircuitBreaker("Groq LLM")
+
+
+class TokenBucket:
+    """Blocking token bucket that smooths outbound calls below an upstream rate limit"""
+    
+    def __init__(self, capacity: int, refill_per_sec: float):
+        self.capacity = capacity
+        self.refill_per_sec = refill_per_sec
+        self._tokens = float(capacity)
+        self._updated_at = time.monotonic()
+        self._cond = threading.Condition(threading.Lock())
+    
+    def acquire(self):
+        """Take one token, waiting for a refill when the bucket is empty"""
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.refill_per_sec)
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                self._cond.wait((1 - self._tokens) / self.refill_per_sec)
+
+
+# Process-wide clone budget - bursts of 30, then one clone every 2 seconds
+clone_bucket = TokenBucket(capacity=30, refill_per_sec=0.5)
+
+
 @dataclass
 class APIEndpoint:
     method: str
@@ -66,7 +190,7 @@ class GitHubAnalyzerService:
         
         # Initialize Groq service if API key is available
         self.groq_service = None
-        groq_api_key = os.getenv('GROQ_API_KEY')
+        groq_api_key = settings.groq_api_key
         if groq_api_key:
             try:
                 from .groq_service import GroqService
@@ -78,22 +202,43 @@ class GitHubAnalyzerService:
         
     def clone_repository(self, github_url: str, github_token: Optional[str] = None) -> str:
         """Clone GitHub repository to temporary directory"""
-        try:
+        # Add token to URL if provided
+        if github_token and 'github.com' in github_url:
+            # Convert https://github.com/user/repo to https://token@github.com/user/repo
+            if github_url.startswith('https://github.com/'):
+                github_url = github_url.replace('https://github.com/', f'https://{github_token}@github.com/')
+        
+        if not clone_breaker.allow():
+            raise Exception("Repository cloning failed: GitHub is unavailable, try again shortly")
+        
+        for attempt in range(CLONE_MAX_ATTEMPTS):
             temp_dir = tempfile.mkdtemp()
-            
-            # Add token to URL if provided
-            if github_token and 'github.com' in github_url:
-                # Convert https://github.com/user/repo to https://token@github.com/user/repo
-                if github_url.startswith('https://github.com/'):
-                    github_url = github_url.replace('https://github.com/', f'https://{github_token}@github.com/')
-            
-            logger.info(f"Cloning repository to {temp_dir}")
-            git.Repo.clone_from(github_url, temp_dir)
-            return temp_dir
-            
-        except Exception as e:
-            logger.error(f"Failed to clone repository: {str(e)}")
-            raise Exception(f"Repository cloning failed: {str(e)}")
+            try:
+                clone_bucket.acquire()
+                logger.info(f"Cloning repository to {temp_dir}")
+                # Analysis only reads the working tree, so skip history and other branches
+                git.Repo.clone_from(github_url, temp_dir, depth=1, single_branch=True)
+                clone_breaker.record_success()
+                return temp_dir
+                
+            except Exception as e:
+                shutil.rmtree(temp_dir, ignore_errors=True)
+                error_msg = str(e)
+                
+                # Retry transient failures with jittered exponential backoff
+                transient = TRANSIENT_CLONE_ERROR_RE.search(error_msg) is not None
+                if transient and attempt + 1 < CLONE_MAX_ATTEMPTS:
+                    delay = 2 ** attempt + random.random()
+                    logger.warning(f"Clone attempt {attempt + 1} failed, retrying in {delay:.1f}s: {error_msg}")
+                    time.sleep(delay)
+                    continue
+                
+                # Bad URLs and auth errors are the caller's problem, not an outage
+                if transient:
+                    clone_breaker.record_failure()
+                
+                logger.error(f"Failed to clone repository: {error_msg}")
+                raise Exception(f"Repository cloning failed: {error_msg}")
     
     def analyze_repository(self, github_url: str, github_token: Optional[str] = None) -> RepositoryAnalysis:
         """Comprehensive repository analysis"""
@@ -106,26 +251,29 @@ class GitHubAnalyzerService:
             project_name = self._extract_project_name(repo_path)
             description = self._extract_description(repo_path)
             
+            # Walk the tree once and share the listing between extractors
+            walk = self._walk_repository(repo_path)
+            
             # Analyze folder structure
-            folder_structure = self._analyze_folder_structure(repo_path)
+            folder_structure = self._analyze_folder_structure(repo_path, walk)
             
             # Detect tech stack
-            tech_stack = self._detect_tech_stack(repo_path)
+            tech_stack = self._detect_tech_stack(repo_path, walk)
             
             # Analyze frontend structure
-            frontend_structure = self._analyze_frontend_structure(repo_path)
+            frontend_structure = self._analyze_frontend_structure(repo_path, walk)
             
             # Analyze backend structure
-            backend_structure = self._analyze_backend_structure(repo_path)
+            backend_structure = self._analyze_backend_structure(repo_path, walk)
             
             # Extract API endpoints
-            api_endpoints = self._extract_api_endpoints(repo_path)
+            api_endpoints = self._extract_api_endpoints(repo_path, walk)
             
             # Analyze components
-            components = self._analyze_components(repo_path)
+            components = self._analyze_components(repo_path, walk)
             
             # Analyze database schema
-            database_schema = self._analyze_database_schema(repo_path)
+            database_schema = self._analyze_database_schema(repo_path, walk)
             
             # Detect build tools
             build_tools = self._detect_build_tools(repo_path)
@@ -134,7 +282,7 @@ class GitHubAnalyzerService:
             dependencies = self._extract_dependencies(repo_path)
             
             # Extract business logic
-            business_logic = self._extract_business_logic(repo_path)
+            business_logic = self._extract_business_logic(repo_path, walk)
             
             # Create initial analysis
             repo_analysis = RepositoryAnalysis(
@@ -152,10 +300,26 @@ class GitHubAnalyzerService:
                 business_logic=business_logic
             )
             
-            # Enhance with LLM analysis if available
-            if self.groq_service:
-                logger.info("Enhancing analysis with Groq LLM...")
-                repo_analysis = self._enhance_analysis_with_llm(repo_analysis, repo_path)
+            # Enhance with LLM analysis if available - race it against a deadline and
+            # fall back to the static analysis rather than waiting out a Groq incident.
+            # The response only ever fills in estimated components, so skip the round-trip
+            # when static analysis already found some
+            if self.groq_service and not repo_analysis.components and llm_breaker.allow():
+                if not _llm_slots.acquire(blocking=False):
+                    logger.warning("LLM workers are all busy with earlier calls, using static analysis")
+                else:
+                    logger.info("Enhancing analysis with Groq LLM...")
+                    # Work on a copy so a late LLM result can't mutate what we return
+                    llm_input = replace(repo_analysis, components=list(repo_analysis.components))
+                    future = _llm_executor.submit(self._enhance_analysis_with_llm, llm_input, repo_path)
+                    # The slot frees when the call really finishes, not when we stop waiting for it
+                    future.add_done_callback(lambda _: _llm_slots.release())
+                    try:
+                        repo_analysis = future.result(timeout=LLM_ENHANCEMENT_TIMEOUT)
+                    except FutureTimeoutError:
+                        # The worker is still blocked on Groq - stop sending new calls until the cool-down
+                        llm_breaker.trip()
+                        logger.warning(f"LLM enhancement exceeded {LLM_ENHANCEMENT_TIMEOUT}s, using static analysis")
             
             return repo_analysis
             
@@ -171,7 +335,7 @@ class GitHubAnalyzerService:
         if os.path.exists(package_json):
             try:
                 with open(package_json, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                    data = _json_loads(f.read())
                     return data.get('name', os.path.basename(repo_path))
             except:
                 pass
@@ -213,22 +377,48 @@ class GitHubAnalyzerService:
         if os.path.exists(package_json):
             try:
                 with open(package_json, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                    data = _json_loads(f.read())
                     return data.get('description', 'No description available')
             except:
                 pass
         
         return 'No description available'
     
-    def _analyze_folder_structure(self, repo_path: str) -> Dict[str, Any]:
+    def _walk_repository(self, repo_path: str) -> List[Tuple[str, str, List[str], List[str]]]:
+        """Walk the repository once, returning (root, rel_path, dirs, files) for every directory"""
+        entries = []
+        for root, dirs, files in os.walk(repo_path):
+            dirs[:] = [d for d in dirs if d not in ALWAYS_SKIPPED_DIRS]
+            entries.append((root, os.path.relpath(root, repo_path), list(dirs), files))
+        return entries
+    
+    def _is_excluded(self, rel_path: str, excluded_dirs, skip_hidden: bool = False) -> bool:
+        """Check whether rel_path lies inside an excluded (or hidden) directory"""
+        if rel_path == '.':
+            return False
+        for part in rel_path.split(os.sep):
+            if part in excluded_dirs or (skip_hidden and part.startswith('.')):
+                return True
+        return False
+    
+    def _iter_source_files(self, repo_path: str, walk: Optional[List], extensions: Tuple[str, ...]):
+        """Lazily yield (rel_path, file, file_path) for walked files ending in one of extensions"""
+        for root, rel_path, dirs, files in (walk if walk is not None else self._walk_repository(repo_path)):
+            for file in files:
+                if file.endswith(extensions):
+                    yield rel_path, file, os.path.join(root, file)
+    
+    def _analyze_folder_structure(self, repo_path: str, walk: Optional[List] = None) -> Dict[str, Any]:
         """Analyze and map folder structure"""
         structure = {}
+        # Skip hidden directories and common build directories
+        excluded = ('build', 'dist', 'target')
         
-        for root, dirs, files in os.walk(repo_path):
-            # Skip hidden directories and common build directories
-            dirs[:] = [d for d in dirs if not d.startswith('.') and d not in ['node_modules', '__pycache__', 'build', 'dist', 'target']]
+        for root, rel_path, dirs, files in (walk if walk is not None else self._walk_repository(repo_path)):
+            if self._is_excluded(rel_path, excluded, skip_hidden=True):
+                continue
+            dirs = [d for d in dirs if not d.startswith('.') and d not in excluded]
             
-            rel_path = os.path.relpath(root, repo_path)
             if rel_path == '.':
                 rel_path = 'root'
             
@@ -236,12 +426,12 @@ class GitHubAnalyzerService:
                 'directories': dirs,
                 'files': files,
                 'file_count': len(files),
-                'file_types': list(set([os.path.splitext(f)[1] for f in files if os.path.splitext(f)[1]]))
+                'file_types': sorted({os.path.splitext(f)[1] for f in files} - {''})
             }
         
         return structure
     
-    def _detect_tech_stack(self, repo_path: str) -> Dict[str, List[str]]:
+    def _detect_tech_stack(self, repo_path: str, walk: Optional[List] = None) -> Dict[str, List[str]]:
         """Detect technology stack from files and dependencies"""
         tech_stack = {
             'frontend': [],
@@ -273,8 +463,9 @@ class GitHubAnalyzerService:
                     tech_stack['backend'].extend(self._analyze_requirements_txt(repo_path))
         
         # Detect languages by file extensions
-        for root, dirs, files in os.walk(repo_path):
-            dirs[:] = [d for d in dirs if not d.startswith('.') and d not in ['node_modules', '__pycache__']]
+        for root, rel_path, dirs, files in (walk if walk is not None else self._walk_repository(repo_path)):
+            if self._is_excluded(rel_path, (), skip_hidden=True):
+                continue
             
             for file in files:
                 ext = os.path.splitext(file)[1].lower()
@@ -293,9 +484,9 @@ class GitHubAnalyzerService:
                 elif ext == '.php':
                     tech_stack['languages'].append('PHP')
         
-        # Remove duplicates
+        # Remove duplicates, keeping detection order so results don't vary with the hash seed
         for key in tech_stack:
-            tech_stack[key] = list(set(tech_stack[key]))
+            tech_stack[key] = list(dict.fromkeys(tech_stack[key]))
         
         return tech_stack
     
@@ -306,7 +497,7 @@ class GitHubAnalyzerService:
         
         try:
             with open(package_json_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+                data = _json_loads(f.read())
                 
                 deps = {**data.get('dependencies', {}), **data.get('devDependencies', {})}
                 
@@ -367,7 +558,7 @@ class GitHubAnalyzerService:
         
         return technologies
     
-    def _analyze_frontend_structure(self, repo_path: str) -> Dict[str, Any]:
+    def _analyze_frontend_structure(self, repo_path: str, walk: Optional[List] = None) -> Dict[str, Any]:
         """Analyze frontend structure - pages, components, routes"""
         structure = {
             'pages': [],
@@ -380,9 +571,7 @@ class GitHubAnalyzerService:
         # Common frontend directories
         frontend_dirs = ['src', 'app', 'pages', 'components', 'views', 'screens']
         
-        for root, dirs, files in os.walk(repo_path):
-            rel_path = os.path.relpath(root, repo_path)
-            
+        for root, rel_path, dirs, files in (walk if walk is not None else self._walk_repository(repo_path)):
             # Skip node_modules and other build directories
             if 'node_modules' in rel_path or '__pycache__' in rel_path:
                 continue
@@ -407,7 +596,7 @@ class GitHubAnalyzerService:
         
         return structure
     
-    def _analyze_backend_structure(self, repo_path: str) -> Dict[str, Any]:
+    def _analyze_backend_structure(self, repo_path: str, walk: Optional[List] = None) -> Dict[str, Any]:
         """Analyze backend structure - services, models, controllers"""
         structure = {
             'services': [],
@@ -418,9 +607,7 @@ class GitHubAnalyzerService:
             'utils': []
         }
         
-        for root, dirs, files in os.walk(repo_path):
-            rel_path = os.path.relpath(root, repo_path)
-            
+        for root, rel_path, dirs, files in (walk if walk is not None else self._walk_repository(repo_path)):
             # Skip build directories
             if any(skip in rel_path for skip in ['node_modules', '__pycache__', '.git']):
                 continue
@@ -451,16 +638,21 @@ class GitHubAnalyzerService:
         
         return structure
     
-    def _extract_api_endpoints(self, repo_path: str) -> List[APIEndpoint]:
+    def _extract_api_endpoints(self, repo_path: str, walk: Optional[List] = None) -> List[APIEndpoint]:
         """Extract all API endpoints from the codebase with enhanced detection"""
         endpoints = []
         
         # Priority files to check first (more likely to contain endpoints)
         priority_patterns = ['main.py', 'app.py', 'server.py', 'index.js', 'server.js', 'routes.py', 'urls.py', 'api.py']
         
-        for root, dirs, files in os.walk(repo_path):
+        if walk is None:
+            walk = self._walk_repository(repo_path)
+        
+        source_files = []
+        for root, rel_path, dirs, files in walk:
             # Skip build directories
-            dirs[:] = [d for d in dirs if d not in ['node_modules', '__pycache__', '.git', 'build', 'dist', 'venv', 'env']]
+            if self._is_excluded(rel_path, ('build', 'dist', 'venv', 'env')):
+                continue
             
             # Sort files to prioritize likely endpoint files
             sorted_files = sorted(files, key=lambda f: (
@@ -471,38 +663,43 @@ class GitHubAnalyzerService:
             
             for file in sorted_files:
                 if any(file.endswith(ext) for ext in ['.py', '.js', '.ts', '.java', '.go', '.rb', '.php']):
-                    file_path = os.path.join(root, file)
-                    file_endpoints = self._extract_endpoints_from_file(file_path)
-                    
-                    for endpoint_data in file_endpoints:
-                        # Skip duplicate endpoints
-                        existing_paths = [ep.path for ep in endpoints]
-                        if endpoint_data.get('path') not in existing_paths:
-                            endpoint = APIEndpoint(
-                                method=endpoint_data.get('method', 'GET'),
-                                path=endpoint_data.get('path', ''),
-                                input_schema=endpoint_data.get('input_schema', {}),
-                                output_schema=endpoint_data.get('output_schema', {}),
-                                purpose=endpoint_data.get('purpose', ''),
-                                dependencies=endpoint_data.get('dependencies', []),
-                                file_location=os.path.relpath(file_path, repo_path),
-                                line_number=endpoint_data.get('line_number', 0)
-                            )
-                            endpoints.append(endpoint)
+                    source_files.append(os.path.join(root, file))
+        
+        # Reading and scanning files is independent per file, so overlap the I/O.
+        # map() keeps walk order, so duplicate resolution is unchanged
+        seen_paths = set()
+        with ThreadPoolExecutor(max_workers=FILE_SCAN_WORKERS, thread_name_prefix="endpoint-scan") as pool:
+            for file_path, file_endpoints in zip(source_files, pool.map(self._extract_endpoints_from_file, source_files)):
+                for endpoint_data in file_endpoints:
+                    # Skip duplicate endpoints
+                    if endpoint_data.get('path') not in seen_paths:
+                        seen_paths.add(endpoint_data.get('path', ''))
+                        endpoint = APIEndpoint(
+                            method=endpoint_data.get('method', 'GET'),
+                            path=endpoint_data.get('path', ''),
+                            input_schema=endpoint_data.get('input_schema', {}),
+                            output_schema=endpoint_data.get('output_schema', {}),
+                            purpose=endpoint_data.get('purpose', ''),
+                            dependencies=endpoint_data.get('dependencies', []),
+                            file_location=os.path.relpath(file_path, repo_path),
+                            line_number=endpoint_data.get('line_number', 0)
+                        )
+                        endpoints.append(endpoint)
         
         # If still no endpoints found, do a more aggressive search
         if len(endpoints) == 0:
-            endpoints = self._aggressive_endpoint_search(repo_path)
+            endpoints = self._aggressive_endpoint_search(repo_path, walk)
         
         return endpoints
     
-    def _aggressive_endpoint_search(self, repo_path: str) -> List[APIEndpoint]:
+    def _aggressive_endpoint_search(self, repo_path: str, walk: Optional[List] = None) -> List[APIEndpoint]:
         """More aggressive search for API endpoints when initial search fails"""
         endpoints = []
         
         # Search for any file that might contain API definitions
-        for root, dirs, files in os.walk(repo_path):
-            dirs[:] = [d for d in dirs if d not in ['node_modules', '__pycache__', '.git', 'build', 'dist']]
+        for root, rel_path, dirs, files in (walk if walk is not None else self._walk_repository(repo_path)):
+            if self._is_excluded(rel_path, ('build', 'dist')):
+                continue
             
             for file in files:
                 if any(file.endswith(ext) for ext in ['.py', '.js', '.ts', '.json', '.yaml', '.yml']):
@@ -551,8 +748,24 @@ class GitHubAnalyzerService:
         
         try:
             if file_path.endswith('.json'):
-                import json
-                data = json.loads(content)
+                # The caller has already read the spec, so parse that text rather than the file again
+                paths = _json_loads(content).get('paths', {})
+                
+                for path, operations in paths.items():
+                    if not isinstance(operations, dict):
+                        continue
+                    for method in operations:
+                        if method.lower() in ('get', 'post', 'put', 'delete', 'patch'):
+                            endpoints.append(APIEndpoint(
+                                method=method.upper(),
+                                path=path,
+                                input_schema={},
+                                output_schema={},
+                                purpose=f'Swagger/OpenAPI endpoint from {os.path.basename(file_path)}',
+                                dependencies=[],
+                                file_location=os.path.relpath(file_path, repo_path),
+                                line_number=0
+                            ))
             else:
                 # Simple YAML parsing for paths
                 lines = content.split('\n')
@@ -761,152 +974,158 @@ class GitHubAnalyzerService:
         
         return classes
     
+    def _read_source(self, file_path: str) -> Optional[str]:
+        """Read a source file once so several extractors can share its content"""
+        try:
+            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+                return f.read()
+        except:
+            return None
+    
     def _extract_routes_from_file(self, file_path: str) -> List[str]:
         """Extract routes from frontend files"""
+        return self._extract_routes_from_content(self._read_source(file_path))
+    
+    def _extract_routes_from_content(self, content: Optional[str]) -> List[str]:
+        """Extract routes from frontend source text"""
         routes = []
+        if content is None:
+            return routes
+        
+        # React Router patterns
+        route_patterns = [
+            r'<Route\s+path=["\']([^"\']+)["\']',
+            r'path:\s*["\']([^"\']+)["\']',
+            r'route\(["\']([^"\']+)["\']'
+        ]
         
-        try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-                
-                # React Router patterns
-                route_patterns = [
-                    r'<Route\s+path=["\']([^"\']+)["\']',
-                    r'path:\s*["\']([^"\']+)["\']',
-                    r'route\(["\']([^"\']+)["\']'
-                ]
-                
-                for pattern in route_patterns:
-                    matches = re.finditer(pattern, content, re.IGNORECASE)
-                    for match in matches:
-                        routes.append(match.group(1))
-        except:
-            pass
+        for pattern in route_patterns:
+            matches = re.finditer(pattern, content, re.IGNORECASE)
+            for match in matches:
+                routes.append(match.group(1))
         
         return routes
     
     def _extract_props_from_file(self, file_path: str) -> Dict[str, Any]:
         """Extract component props from frontend files"""
+        return self._extract_props_from_content(self._read_source(file_path))
+    
+    def _extract_props_from_content(self, content: Optional[str]) -> Dict[str, Any]:
+        """Extract component props from frontend source text"""
         props = {}
+        if content is None:
+            return props
         
-        try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-                
-                # React props pattern
-                props_pattern = r'(?:interface|type)\s+\w*Props\s*=?\s*{([^}]+)}'
-                match = re.search(props_pattern, content, re.DOTALL)
-                
-                if match:
-                    props_content = match.group(1)
-                    prop_lines = props_content.split('\n')
-                    
-                    for line in prop_lines:
-                        line = line.strip()
-                        if ':' in line:
-                            prop_match = re.match(r'(\w+)\??\s*:\s*([^;,]+)', line)
-                            if prop_match:
-                                props[prop_match.group(1)] = prop_match.group(2).strip()
-        except:
-            pass
+        # React props pattern
+        props_pattern = r'(?:interface|type)\s+\w*Props\s*=?\s*{([^}]+)}'
+        match = re.search(props_pattern, content, re.DOTALL)
+        
+        if match:
+            props_content = match.group(1)
+            prop_lines = props_content.split('\n')
+            
+            for line in prop_lines:
+                line = line.strip()
+                if ':' in line:
+                    prop_match = re.match(r'(\w+)\??\s*:\s*([^;,]+)', line)
+                    if prop_match:
+                        props[prop_match.group(1)] = prop_match.group(2).strip()
         
         return props
     
-    def _analyze_components(self, repo_path: str) -> List[ComponentInfo]:
+    def _analyze_components(self, repo_path: str, walk: Optional[List] = None) -> List[ComponentInfo]:
         """Analyze all components in the repository"""
         components = []
         
-        for root, dirs, files in os.walk(repo_path):
-            dirs[:] = [d for d in dirs if d not in ['node_modules', '__pycache__', '.git']]
+        for rel_path, file, file_path in self._iter_source_files(repo_path, walk, ('.js', '.jsx', '.ts', '.tsx', '.vue', '.svelte')):
+            # Read once and run every extractor over the same content
+            content = self._read_source(file_path)
             
-            for file in files:
-                if any(file.endswith(ext) for ext in ['.js', '.jsx', '.ts', '.tsx', '.vue', '.svelte']):
-                    file_path = os.path.join(root, file)
-                    
-                    component = ComponentInfo(
-                        name=os.path.splitext(file)[0],
-                        type=self._determine_component_type(file_path),
-                        file_path=os.path.relpath(file_path, repo_path),
-                        dependencies=self._extract_imports_from_file(file_path),
-                        exports=self._extract_exports_from_file(file_path),
-                        props=self._extract_props_from_file(file_path),
-                        routes=self._extract_routes_from_file(file_path)
-                    )
-                    components.append(component)
+            component = ComponentInfo(
+                name=os.path.splitext(file)[0],
+                type=self._determine_component_type_from_content(content),
+                file_path=os.path.relpath(file_path, repo_path),
+                dependencies=self._extract_imports_from_content(content),
+                exports=self._extract_exports_from_content(content),
+                props=self._extract_props_from_content(content),
+                routes=self._extract_routes_from_content(content)
+            )
+            components.append(component)
         
         return components
     
     def _determine_component_type(self, file_path: str) -> str:
         """Determine the type of component based on file content and location"""
-        try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-                
-                if 'useState' in content or 'useEffect' in content:
-                    return 'React Component'
-                elif 'Vue.component' in content or '<template>' in content:
-                    return 'Vue Component'
-                elif 'export default' in content and 'function' in content:
-                    return 'Function Component'
-                elif 'class' in content and 'extends' in content:
-                    return 'Class Component'
-                else:
-                    return 'Module'
-        except:
+        return self._determine_component_type_from_content(self._read_source(file_path))
+    
+    def _determine_component_type_from_content(self, content: Optional[str]) -> str:
+        """Determine the type of component from its source text"""
+        if content is None:
             return 'Unknown'
+        
+        if 'useState' in content or 'useEffect' in content:
+            return 'React Component'
+        elif 'Vue.component' in content or '<template>' in content:
+            return 'Vue Component'
+        elif 'export default' in content and 'function' in content:
+            return 'Function Component'
+        elif 'class' in content and 'extends' in content:
+            return 'Class Component'
+        else:
+            return 'Module'
     
     def _extract_imports_from_file(self, file_path: str) -> List[str]:
         """Extract import statements from a file"""
+        return self._extract_imports_from_content(self._read_source(file_path))
+    
+    def _extract_imports_from_content(self, content: Optional[str]) -> List[str]:
+        """Extract import statements from source text"""
         imports = []
+        if content is None:
+            return imports
+        
+        # JavaScript/TypeScript import patterns
+        import_patterns = [
+            r'import\s+.*?\s+from\s+["\']([^"\']+)["\']',
+            r'import\s+["\']([^"\']+)["\']',
+            r'require\(["\']([^"\']+)["\']\)'
+        ]
         
-        try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-                
-                # JavaScript/TypeScript import patterns
-                import_patterns = [
-                    r'import\s+.*?\s+from\s+["\']([^"\']+)["\']',
-                    r'import\s+["\']([^"\']+)["\']',
-                    r'require\(["\']([^"\']+)["\']\)'
-                ]
-                
-                for pattern in import_patterns:
-                    matches = re.finditer(pattern, content)
-                    for match in matches:
-                        imports.append(match.group(1))
-        except:
-            pass
+        for pattern in import_patterns:
+            matches = re.finditer(pattern, content)
+            for match in matches:
+                imports.append(match.group(1))
         
         return imports
     
     def _extract_exports_from_file(self, file_path: str) -> List[str]:
         """Extract export statements from a file"""
+        return self._extract_exports_from_content(self._read_source(file_path))
+    
+    def _extract_exports_from_content(self, content: Optional[str]) -> List[str]:
+        """Extract export statements from source text"""
         exports = []
+        if content is None:
+            return exports
         
-        try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-                
-                export_patterns = [
-                    r'export\s+(?:default\s+)?(?:function\s+)?(\w+)',
-                    r'export\s+{\s*([^}]+)\s*}',
-                    r'module\.exports\s*=\s*(\w+)'
-                ]
-                
-                for pattern in export_patterns:
-                    matches = re.finditer(pattern, content)
-                    for match in matches:
-                        export_item = match.group(1)
-                        if ',' in export_item:
-                            exports.extend([item.strip() for item in export_item.split(',')])
-                        else:
-                            exports.append(export_item)
-        except:
-            pass
+        export_patterns = [
+            r'export\s+(?:default\s+)?(?:function\s+)?(\w+)',
+            r'export\s+{\s*([^}]+)\s*}',
+            r'module\.exports\s*=\s*(\w+)'
+        ]
+        
+        for pattern in export_patterns:
+            matches = re.finditer(pattern, content)
+            for match in matches:
+                export_item = match.group(1)
+                if ',' in export_item:
+                    exports.extend([item.strip() for item in export_item.split(',')])
+                else:
+                    exports.append(export_item)
         
         return exports
     
-    def _analyze_database_schema(self, repo_path: str) -> Dict[str, Any]:
+    def _analyze_database_schema(self, repo_path: str, walk: Optional[List] = None) -> Dict[str, Any]:
         """Analyze database schema from migration files, models, or SQL files"""
         schema = {
             'tables': [],
@@ -916,7 +1135,7 @@ class GitHubAnalyzerService:
         
         # Look for database-related files
         db_files = []
-        for root, dirs, files in os.walk(repo_path):
+        for root, rel_path, dirs, files in (walk if walk is not None else self._walk_repository(repo_path)):
             for file in files:
                 if any(file.endswith(ext) for ext in ['.sql', '.prisma']) or 'migration' in file.lower():
                     db_files.append(os.path.join(root, file))
@@ -1000,7 +1219,7 @@ class GitHubAnalyzerService:
         if os.path.exists(package_json):
             try:
                 with open(package_json, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                    data = _json_loads(f.read())
                     dependencies['production'].extend(list(data.get('dependencies', {}).keys()))
                     dependencies['development'].extend(list(data.get('devDependencies', {}).keys()))
                     dependencies['javascript'] = dependencies['production'] + dependencies['development']
@@ -1019,7 +1238,7 @@ class GitHubAnalyzerService:
         
         return dependencies
     
-    def _extract_business_logic(self, repo_path: str) -> List[str]:
+    def _extract_business_logic(self, repo_path: str, walk: Optional[List] = None) -> List[str]:
         """Extract business logic patterns and key functionality"""
         business_logic = []
         
@@ -1038,23 +1257,21 @@ class GitHubAnalyzerService:
             'error handling'
         ]
         
-        for root, dirs, files in os.walk(repo_path):
-            dirs[:] = [d for d in dirs if d not in ['node_modules', '__pycache__', '.git']]
+        for rel_path, file, file_path in self._iter_source_files(repo_path, walk, ('.py', '.js', '.ts')):
+            # Files are produced lazily, so stop reading once every pattern has been seen
+            if len(business_logic) == len(patterns):
+                break
             
-            for file in files:
-                if any(file.endswith(ext) for ext in ['.py', '.js', '.ts']):
-                    file_path = os.path.join(root, file)
+            try:
+                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+                    content = f.read().lower()
                     
-                    try:
-                        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                            content = f.read().lower()
-                            
-                            for pattern in patterns:
-                                if pattern.replace(' ', '') in content or pattern in content:
-                                    if pattern not in business_logic:
-                                        business_logic.append(pattern)
-                    except:
-                        pass
+                    for pattern in patterns:
+                        if pattern.replace(' ', '') in content or pattern in content:
+                            if pattern not in business_logic:
+                                business_logic.append(pattern)
+            except:
+                pass
         
         return business_logic
     
@@ -1074,73 +1291,77 @@ class GitHubAnalyzerService:
         
         return purpose
     
+    def _cached_completion(self, prompt: str) -> Optional[str]:
+        """Return the Groq completion for prompt, reusing the result for an identical prompt"""
+        key = hashlib.sha256(prompt.encode()).hexdigest()
+        with _llm_cache_lock:
+            if key in _llm_completion_cache:
+                _llm_completion_cache.move_to_end(key)
+                logger.info("Reusing cached LLM completion")
+                return _llm_completion_cache[key]
+        
+        response = self.groq_service._generate_completion(prompt)
+        if response:
+            with _llm_cache_lock:
+                _llm_completion_cache[key] = response
+                _llm_completion_cache.move_to_end(key)
+                while len(_llm_completion_cache) > LLM_CACHE_MAXSIZE:
+                    _llm_completion_cache.popitem(last=False)
+        return response
+    
     def _enhance_analysis_with_llm(self, repo_analysis: 'RepositoryAnalysis', repo_path: str) -> 'RepositoryAnalysis':
         """Enhance repository analysis using Groq LLM"""
         if not self.groq_service:
             return repo_analysis
         
         try:
-            # Prepare context for LLM analysis
+            # Prepare context for LLM analysis - only the fields the prompt uses
             analysis_context = {
                 'project_name': repo_analysis.project_name,
                 'description': repo_analysis.description,
                 'languages': repo_analysis.tech_stack.get('languages', []),
                 'file_count': sum(len(folder_info.get('files', [])) for folder_info in repo_analysis.folder_structure.values() if isinstance(folder_info, dict)),
-                'folder_structure': list(repo_analysis.folder_structure.keys())[:10],  # Top 10 folders
-                'dependencies': {
-                    'production': repo_analysis.dependencies.get('production', [])[:10],
-                    'development': repo_analysis.dependencies.get('development', [])[:5]
-                },
-                'build_tools': repo_analysis.build_tools,
-                'business_logic': repo_analysis.business_logic[:5]  # Top 5 business logic items
+                'folder_structure': list(islice(repo_analysis.folder_structure, 10)),  # Top 10 folders
+                'build_tools': repo_analysis.build_tools
             }
             
-            # Create LLM prompt for enhanced analysis
-            prompt = f"""
-            Analyze this GitHub repository and provide enhanced insights:
-            
-            Project: {analysis_context['project_name']}
-            Description: {analysis_context['description']}
-            Languages: {', '.join(analysis_context['languages'])}
-            File Count: {analysis_context['file_count']}
-            Key Folders: {', '.join(analysis_context['folder_structure'])}
-            Build Tools: {', '.join(analysis_context['build_tools'])}
-            
-            Based on this information, provide:
-            1. Estimated API endpoints (if this is a web application)
-            2. Estimated number of components (if this has a frontend)
-            3. Estimated number of services (if this has a backend)
-            4. Application type classification
-            5. Architecture pattern
-            
-            Respond in JSON format:
-            {{
-                "estimated_api_endpoints": <number>,
-                "estimated_components": <number>, 
-                "estimated_services": <number>,
-                "application_type": "<type>",
-                "architecture_pattern": "<pattern>",
-                "confidence_score": <0-100>
-            }}
-            """
+            # Create LLM prompt for enhanced analysis (unindented - whitespace costs tokens)
+            prompt = f"""Analyze this GitHub repository and provide enhanced insights:
+
+Project: {analysis_context['project_name']}
+Description: {analysis_context['description']}
+Languages: {', '.join(analysis_context['languages'])}
+File Count: {analysis_context['file_count']}
+Key Folders: {', '.join(analysis_context['folder_structure'])}
+Build Tools: {', '.join(analysis_context['build_tools'])}
+
+Based on this information, provide:
+1. Estimated API endpoints (if this is a web application)
+2. Estimated number of components (if this has a frontend)
+3. Estimated number of services (if this has a backend)
+4. Application type classification
+5. Architecture pattern
+
+Respond in compact JSON format:
+{{"estimated_api_endpoints": <number>, "estimated_components": <number>, "estimated_services": <number>, "application_type": "<type>", "architecture_pattern": "<pattern>", "confidence_score": <0-100>}}
+"""
             
-            # Get LLM analysis
-            llm_response = self.groq_service._generate_completion(prompt)
+            # Get LLM analysis - only transport/API failures say the service is unhealthy
+            try:
+                llm_response = self._cached_completion(prompt)
+            except Exception as e:
+                llm_breaker.record_failure()
+                logger.warning(f"LLM enhancement failed: {str(e)}")
+                return repo_analysis
+            llm_breaker.record_success()
             
             if llm_response:
                 # Try to parse JSON response
                 try:
-                    import json
                     # Clean the response
-                    content = llm_response.strip()
-                    if content.startswith('```json'):
-                        content = content[7:]
-                    if content.startswith('```'):
-                        content = content[3:]
-                    if content.endswith('```'):
-                        content = content[:-3]
+                    content = _strip_fences(llm_response)
                     
-                    llm_analysis = json.loads(content.strip())
+                    llm_analysis = _json_loads(content)
                     
                     # Update repository analysis with LLM insights
                     if llm_analysis.get('confidence_score', 0) > 70:  # Only use if confidence is high
@@ -1164,8 +1385,9 @@ class GitHubAnalyzerService:
                         
                         logger.info(f"LLM enhanced analysis: endpoints, {estimated_components} components")
                     
-                except json.JSONDecodeError:
-                    logger.warning("Could not parse LLM response as JSON")
+                except (ValueError, TypeError, AttributeError) as e:
+                    # Malformed JSON or an unexpected shape - the model answered, so not a breaker failure
+                    logger.warning(f"Could not use LLM response: {str(e)}")
             
         except Exception as e:
             logger.warning(f"LLM enhancement failed: {str(e)}")
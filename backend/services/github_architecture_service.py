@@ -32,16 +32,18 @@ class GitHubArchitectureService:
         self, 
         github_url: str, 
         github_token: Optional[str] = None,
-        prd_content: Optional[str] = None
+        prd_content: Optional[str] = None,
+        repo_analysis: Optional[RepositoryAnalysis] = None
     ) -> SystemArchitecture:
         """Generate comprehensive system architecture from GitHub repository and optional PRD"""
         
         try:
             logger.info(f"Starting architecture generation for: {github_url}")
             
-            # Step 1: Analyze GitHub repository
-            logger.info("Analyzing GitHub repository...")
-            repo_analysis = self.github_analyzer.analyze_repository(github_url, github_token)
+            # Step 1: Analyze GitHub repository (skipped when the caller already has an analysis)
+            if repo_analysis is None:
+                logger.info("Analyzing GitHub repository...")
+                repo_analysis = self.github_analyzer.analyze_repository(github_url, github_token)
             
             # Step 2: Generate unified architecture
             logger.info("Generating unified system architecture...")
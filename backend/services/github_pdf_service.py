@@ -1,68 +1,147 @@
 import os
 import json
 import re
+import tempfile
+import importlib
+import multiprocessing
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from operator import attrgetter
 from typing import Dict, List, Any
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.lib.colors import HexColor, black, white
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak, Flowable
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
 import logging
 from xml.sax.saxutils import escape
 from datetime import datetime
 
-# Universal file readers
-try:
-    from docx import Document
-except ImportError:
-    Document = None
+# Universal file readers - imported on first use, since pandas and pdfplumber cost more
+# at import time than ReportLab itself and most reports never read an uploaded file
+@lru_cache(maxsize=None)
+def _optional_module(name: str):
+    """Import an optional reader dependency, or None if it isn't installed"""
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
 
-try:
-    import PyPDF2
-except ImportError:
-    PyPDF2 = None
+from .github_architecture_service import SystemArchitecture
+from .content_keys import content_digest
+from .diagram_generator import ArchitectureDiagramGenerator
+from .layered_diagram_generator import LayeredDataFlowGenerator
 
-try:
-    from pptx import Presentation
-except ImportError:
-    Presentation = None
+logger = logging.getLogger(__name__)
 
-try:
-    import pdfplumber
-except ImportError:
-    pdfplumber = None
+GITHUB_REPO_NAME_RE = re.compile(r'github\.com/[^/]+/([^/\.]+)')
 
-try:
-    import openpyxl
-except ImportError:
-    openpyxl = None
+# Usable width inside the report frame: 72pt side margins plus the frame's 6pt padding
+BODY_WIDTH = A4[0] - 2 * inch - 12
 
-try:
-    import pandas as pd
-except ImportError:
-    pd = None
+# Spacing and column widths reused across sections, scaled to points once
+SECTION_GAP = 0.2 * inch
+ENDPOINT_GAP = 0.15 * inch
+KEY_VALUE_COL_WIDTHS = (2 * inch, 4 * inch)
+REQUEST_FIELD_COL_WIDTHS = (1.2 * inch, 0.8 * inch, 0.7 * inch, 2.8 * inch)
+RESPONSE_FIELD_COL_WIDTHS = (1.5 * inch, 1 * inch, 3 * inch)
 
-from .github_architecture_service import SystemArchitecture
-from .diagram_generator import ArchitectureDiagramGenerator
-from .layered_diagram_generator import LayeredDataFlowGenerator
+# Bullet lists are laid out as one-column tables; very long tables lay out slowly,
+# so split them into chunks
+BULLET_TABLE_MAX_ROWS = 200
+BULLET_TABLE_STYLE = TableStyle([
+    ('LEFTPADDING', (0, 0), (-1, -1), 0),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 0),
+    # Cells ignore the style's spaceAfter, so reproduce CustomBullet's 4pt gap as padding
+    ('TOPPADDING', (0, 0), (-1, -1), 0),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
+])
 
-logger = logging.getLogger(__name__)
+# APIEndpoint attributes carried into the report, read in one C-level call per endpoint
+ENDPOINT_REPORT_FIELDS = ('method', 'path', 'purpose', 'file_location')
+_endpoint_report_fields = attrgetter(*ENDPOINT_REPORT_FIELDS)
+
+
+def report_content_key(github_url: str, prd_included: bool, repo_analysis: Dict, prd_analysis: Dict, generated_on: str) -> str:
+    """Short BLAKE2b digest of everything a report's content depends on"""
+    return content_digest(github_url, prd_included, repo_analysis, prd_analysis, generated_on)
+
+
+@lru_cache(maxsize=1024)
+def repo_title_from_url(github_url: str) -> str:
+    """Turn a GitHub repository URL into a readable title, e.g. 'my-cool_app' -> 'My Cool App'"""
+    match = GITHUB_REPO_NAME_RE.search(github_url)
+    if not match:
+        return ''
+    # Keep words longer than 1 character, capitalized
+    return ' '.join(word.capitalize() for word in re.sub(r'[_-]', ' ', match.group(1)).split() if len(word) > 1)
+
+
+REPORT_COLORS = {
+    'primary': HexColor('#2E86AB'),
+    'secondary': HexColor('#A23B72'),
+    'text': HexColor('#2D3748'),
+    'light_gray': HexColor('#F7FAFC'),
+    'medium_gray': HexColor('#E2E8F0'),
+}
+
+
+@lru_cache(maxsize=1)
+def get_report_styles():
+    """Sample stylesheet plus the report's custom styles, built once per process"""
+    styles = getSampleStyleSheet()
+    styles.add(ParagraphStyle(name='CustomTitle', parent=styles['Title'], fontSize=24, spaceAfter=30, textColor=REPORT_COLORS['primary'], alignment=TA_CENTER, fontName='Helvetica-Bold'))
+    styles.add(ParagraphStyle(name='CustomHeading1', parent=styles['Heading1'], fontSize=18, spaceAfter=12, spaceBefore=20, textColor=REPORT_COLORS['primary'], fontName='Helvetica-Bold'))
+    styles.add(ParagraphStyle(name='CustomHeading2', parent=styles['Heading2'], fontSize=14, spaceAfter=10, spaceBefore=15, textColor=REPORT_COLORS['secondary'], fontName='Helvetica-Bold'))
+    styles.add(ParagraphStyle(name='CustomBody', parent=styles['Normal'], fontSize=10, spaceAfter=6, textColor=REPORT_COLORS['text'], alignment=TA_JUSTIFY))
+    styles.add(ParagraphStyle(name='CustomBullet', parent=styles['Normal'], fontSize=10, spaceAfter=4, leftIndent=20, textColor=REPORT_COLORS['text']))
+    # Bullets joined with <br/> in one Paragraph; the extra leading stands in for CustomBullet's spaceAfter
+    styles.add(ParagraphStyle(name='CustomBulletBlock', parent=styles['CustomBullet'], leading=16))
+    styles.add(ParagraphStyle(name='GitHubCode', parent=styles['Normal'], fontSize=9, fontName='Courier', textColor=REPORT_COLORS['text'], backColor=REPORT_COLORS['light_gray'], leftIndent=10, rightIndent=10, spaceAfter=6))
+    return styles
+
+
+class PlainLines(Flowable):
+    """Short single-line strings drawn straight onto the canvas - no markup parsing or wrapping"""
+    def __init__(self, lines: List[str], style: ParagraphStyle):
+        super().__init__()
+        self.lines = lines
+        self.style = style
+        # Match the pitch of one Paragraph per line in this style
+        self.line_pitch = style.leading + style.spaceAfter
+    
+    def wrap(self, availWidth, availHeight):
+        self.width = availWidth
+        self.height = len(self.lines) * self.line_pitch
+        return self.width, self.height
+
+    def split(self, availWidth, availHeight):
+        # Break between lines so a long list flows onto the next frame instead of raising LayoutError
+        fit = int(availHeight // self.line_pitch)
+        if fit <= 0:
+            return []
+        if fit >= len(self.lines):
+            return [self]
+        return [PlainLines(self.lines[:fit], self.style), PlainLines(self.lines[fit:], self.style)]
+
+    def draw(self):
+        # One BT/ET text object for the whole block instead of one per drawString
+        text = self.canv.beginText(self.style.leftIndent, self.height - self.style.leading)
+        text.setFont(self.style.fontName, self.style.fontSize, leading=self.line_pitch)
+        text.setFillColor(self.style.textColor)
+        text.textLines(self.lines)
+        self.canv.drawText(text)
+
+
+def _render_report_job(job: Dict[str, Any]) -> str:
+    """Process-pool entry point: render one report from generate_architecture_pdf kwargs"""
+    job = dict(job)
+    service = GitHubPDFService(output_dir=job.pop('output_dir', 'generated_pdfs'))
+    return service.generate_architecture_pdf(**job)
 
-class MockRepoAnalysis:
-    """Mock repository analysis object for diagram generation"""
-    def __init__(self, repo_data):
-        self.tech_stack = {
-            'frontend': repo_data.get('frontend_tech', []),
-            'backend': repo_data.get('backend_tech', []),
-            'languages': list(repo_data.get('languages', {}).keys()),
-            'database': repo_data.get('database_tech', [])
-        }
-        self.api_endpoints = repo_data.get('api_endpoints', [])
-        self.components = [f"Component_{i}" for i in range(repo_data.get('components_total', 0))]
-        self.backend_structure = {'services': []}
-        self.business_logic = []
-        self.dependencies = {'production': []}
 
 class GitHubPDFService:
     def __init__(self, output_dir: str = "generated_pdfs"):
@@ -70,27 +149,40 @@ class GitHubPDFService:
         os.makedirs(output_dir, exist_ok=True)
 
         
-        self.colors = {
-            'primary': HexColor('#2E86AB'),
-            'secondary': HexColor('#A23B72'),
-            'text': HexColor('#2D3748'),
-            'light_gray': HexColor('#F7FAFC'),
-            'medium_gray': HexColor('#E2E8F0'),
-        }
-        
-        self.styles = getSampleStyleSheet()
-        self._setup_custom_styles()
+        self.colors = REPORT_COLORS
+        # Shared, read-only stylesheet - building it is part of every request otherwise
+        self.styles = get_report_styles()
+        
+        # Per-report memo for values derived from repo/PRD analysis (reset in generate_architecture_pdf)
+        self._report_cache = {}
+    
+    def _para(self, text: str, style_name: str) -> Paragraph:
+        """Paragraph for text, parsing each distinct (text, style) markup once per report"""
+        frag_cache = self._report_cache.setdefault('paragraph_frags', {})
+        frags = frag_cache.get((text, style_name))
+        if frags is None:
+            para = Paragraph(text, self.styles[style_name])
+            frag_cache[(text, style_name)] = para.frags
+            return para
+        # ReportLab mutates Paragraphs during layout, so share only the parsed fragments
+        return Paragraph(text, self.styles[style_name], frags=frags)
+    
+    def _bullet_table(self, items) -> List:
+        """Lay out a bullet list as single-column Tables rather than one flowable per item"""
+        rows = [[self._para(f"• {item}", 'CustomBullet')] for item in items]
+        tables = []
+        for start in range(0, len(rows), BULLET_TABLE_MAX_ROWS):
+            table = Table(rows[start:start + BULLET_TABLE_MAX_ROWS], colWidths=[BODY_WIDTH])
+            table.setStyle(BULLET_TABLE_STYLE)
+            tables.append(table)
+        return tables
+    
+    def _bullet_block(self, items) -> Paragraph:
+        """Short bullet list as one Paragraph with <br/> line breaks instead of one flowable per item"""
+        return Paragraph("<br/>".join(f"• {escape(str(item))}" for item in items), self.styles['CustomBulletBlock'])
     
     def _sanitize_text(self, text: Any) -> str:
         return "" if not text else escape(str(text))
-
-    def _setup_custom_styles(self):
-        self.styles.add(ParagraphStyle(name='CustomTitle', parent=self.styles['Title'], fontSize=24, spaceAfter=30, textColor=self.colors['primary'], alignment=TA_CENTER, fontName='Helvetica-Bold'))
-        self.styles.add(ParagraphStyle(name='CustomHeading1', parent=self.styles['Heading1'], fontSize=18, spaceAfter=12, spaceBefore=20, textColor=self.colors['primary'], fontName='Helvetica-Bold'))
-        self.styles.add(ParagraphStyle(name='CustomHeading2', parent=self.styles['Heading2'], fontSize=14, spaceAfter=10, spaceBefore=15, textColor=self.colors['secondary'], fontName='Helvetica-Bold'))
-        self.styles.add(ParagraphStyle(name='CustomBody', parent=self.styles['Normal'], fontSize=10, spaceAfter=6, textColor=self.colors['text'], alignment=TA_JUSTIFY))
-        self.styles.add(ParagraphStyle(name='CustomBullet', parent=self.styles['Normal'], fontSize=10, spaceAfter=4, leftIndent=20, textColor=self.colors['text']))
-        self.styles.add(ParagraphStyle(name='GitHubCode', parent=self.styles['Normal'], fontSize=9, fontName='Courier', textColor=self.colors['text'], backColor=self.colors['light_gray'], leftIndent=10, rightIndent=10, spaceAfter=6))
     
     def extract_text_from_file(self, file_path: str) -> str:
         """Universal document reader - supports PDF, DOCX, PPTX, XLSX, TXT, and more"""
@@ -124,32 +216,37 @@ class GitHubPDFService:
     
     def _extract_pdf_text(self, file_path: str) -> str:
         """Extract text from PDF files with multiple fallback methods"""
-        text = ""
-        
         # Try pdfplumber first (better text extraction)
+        pdfplumber = _optional_module('pdfplumber')
         if pdfplumber:
             try:
+                # Collect pages and join once - repeated += copies the growing string
+                parts = []
                 with pdfplumber.open(file_path) as pdf:
                     for page in pdf.pages:
                         page_text = page.extract_text()
                         if page_text:
-                            text += page_text + "\n"
+                            parts.append(page_text)
+                text = "\n".join(parts)
                 if text.strip():
-                    return text
+                    return text + "\n"
             except Exception as e:
                 logger.warning(f"pdfplumber failed: {e}")
         
         # Fallback to PyPDF2
+        PyPDF2 = _optional_module('PyPDF2')
         if PyPDF2:
             try:
+                parts = []
                 with open(file_path, 'rb') as f:
                     reader = PyPDF2.PdfReader(f)
                     for page in reader.pages:
                         page_text = page.extract_text()
                         if page_text:
-                            text += page_text + "\n"
+                            parts.append(page_text)
+                text = "\n".join(parts)
                 if text.strip():
-                    return text
+                    return text + "\n"
             except Exception as e:
                 logger.warning(f"PyPDF2 failed: {e}")
         
@@ -157,70 +254,70 @@ class GitHubPDFService:
     
     def _extract_word_text(self, file_path: str) -> str:
         """Extract text from Word documents with enhanced cleaning"""
-        if not Document:
+        docx = _optional_module('docx')
+        if not docx:
             raise ImportError("python-docx not available. Install: pip install python-docx")
         
-        text = ""
-        doc = Document(file_path)
+        lines = []
+        doc = docx.Document(file_path)
         
         # Extract paragraphs
-        for para in doc.paragraphs:
-            if para.text.strip():
-                text += para.text + "\n"
+        lines.extend(para.text for para in doc.paragraphs if para.text.strip())
         
         # Extract tables
         for table in doc.tables:
             for row in table.rows:
                 row_text = ' | '.join([cell.text.strip() for cell in row.cells if cell.text.strip()])
                 if row_text.strip():
-                    text += row_text + "\n"
+                    lines.append(row_text)
         
-        return text
+        return "".join(line + "\n" for line in lines)
     
     def _extract_powerpoint_text(self, file_path: str) -> str:
         """Extract text from PowerPoint presentations"""
-        if not Presentation:
+        pptx = _optional_module('pptx')
+        if not pptx:
             raise ImportError("python-pptx not available. Install: pip install python-pptx")
         
-        text = ""
-        prs = Presentation(file_path)
+        parts = []
+        prs = pptx.Presentation(file_path)
         
         for slide_num, slide in enumerate(prs.slides, 1):
-            text += f"\n--- Slide {slide_num} ---\n"
+            parts.append(f"\n--- Slide {slide_num} ---\n")
             for shape in slide.shapes:
                 if hasattr(shape, "text") and shape.text.strip():
-                    text += shape.text + "\n"
+                    parts.append(shape.text + "\n")
         
-        return text
+        return "".join(parts)
     
     def _extract_excel_text(self, file_path: str) -> str:
         """Extract text from Excel files"""
-        text = ""
-        
         # Try pandas first
+        pd = _optional_module('pandas')
         if pd:
             try:
                 df = pd.read_excel(file_path, sheet_name=None)  # Read all sheets
-                for sheet_name, sheet_df in df.items():
-                    text += f"\n--- Sheet: {sheet_name} ---\n"
-                    text += sheet_df.to_string(index=False) + "\n"
-                return text
+                return "".join(
+                    f"\n--- Sheet: {sheet_name} ---\n{sheet_df.to_string(index=False)}\n"
+                    for sheet_name, sheet_df in df.items()
+                )
             except Exception as e:
                 logger.warning(f"pandas Excel read failed: {e}")
         
         # Fallback to openpyxl
+        openpyxl = _optional_module('openpyxl')
         if openpyxl:
             try:
-                from openpyxl import load_workbook
-                wb = load_workbook(file_path, data_only=True)
+                wb = openpyxl.load_workbook(file_path, data_only=True)
+                parts = []
                 for sheet_name in wb.sheetnames:
-                    text += f"\n--- Sheet: {sheet_name} ---\n"
+                    parts.append(f"\n--- Sheet: {sheet_name} ---\n")
                     ws = wb[sheet_name]
                     for row in ws.iter_rows(values_only=True):
                         row_text = ' | '.join([str(cell) for cell in row if cell is not None])
                         if row_text.strip():
-                            text += row_text + "\n"
-                return text
+                            parts.append(row_text + "\n")
+                return "".join(parts)
             except Exception as e:
                 logger.warning(f"openpyxl failed: {e}")
         
@@ -294,15 +391,6 @@ class GitHubPDFService:
         
         return clean_text.strip()
 
-    def _setup_custom_styles(self):
-        self.styles.add(ParagraphStyle(name='CustomTitle', parent=self.styles['Title'], fontSize=24, spaceAfter=30, textColor=self.colors['primary'], alignment=TA_CENTER, fontName='Helvetica-Bold'))
-        self.styles.add(ParagraphStyle(name='CustomHeading1', parent=self.styles['Heading1'], fontSize=18, spaceAfter=12, spaceBefore=20, textColor=self.colors['primary'], fontName='Helvetica-Bold'))
-        self.styles.add(ParagraphStyle(name='CustomHeading2', parent=self.styles['Heading2'], fontSize=14, spaceAfter=10, spaceBefore=15, textColor=self.colors['secondary'], fontName='Helvetica-Bold'))
-        self.styles.add(ParagraphStyle(name='CustomBody', parent=self.styles['Normal'], fontSize=10, spaceAfter=6, textColor=self.colors['text'], alignment=TA_JUSTIFY))
-        self.styles.add(ParagraphStyle(name='CustomBullet', parent=self.styles['Normal'], fontSize=10, spaceAfter=4, leftIndent=20, textColor=self.colors['text']))
-        self.styles.add(ParagraphStyle(name='GitHubCode', parent=self.styles['Normal'], fontSize=9, fontName='Courier', textColor=self.colors['text'], backColor=self.colors['light_gray'], leftIndent=10, rightIndent=10, spaceAfter=6))
-        self.styles.add(ParagraphStyle(name='PlainASCII', parent=self.styles['Normal'], fontSize=9, fontName='Courier-Bold', textColor=black, leftIndent=0, rightIndent=0, spaceAfter=2, spaceBefore=0, alignment=TA_LEFT))
-
     def analyze_repo_from_object(self, repo_analysis) -> Dict:
         """Convert repo_analysis object to expected format with real data extraction"""
         try:
@@ -362,12 +450,8 @@ class GitHubPDFService:
                 'build_tools': build_tools,
                 'components_total': actual_components,
                 'pages_total': 0,  # Not tracked in RepositoryAnalysis
-                'api_endpoints': [{
-                    'method': ep.method,
-                    'path': ep.path,
-                    'purpose': ep.purpose,
-                    'file_location': ep.file_location
-                } for ep in api_endpoints],
+                'api_endpoints': [dict(zip(ENDPOINT_REPORT_FIELDS, fields))
+                                  for fields in map(_endpoint_report_fields, api_endpoints)],
                 'patterns': self._infer_architecture_pattern(frontend_tech, backend_tech),
                 'file_count': actual_file_count,
                 'total_lines': 0,  # Not tracked in RepositoryAnalysis
@@ -475,45 +559,6 @@ class GitHubPDFService:
         
         return languages or ['JavaScript']  # Default to JavaScript if nothing detected
     
-    def _generate_frontend_architecture_diagram(self) -> str:
-        """Generate dynamic frontend architecture diagram with real data"""
-        # Generate a simple text-based diagram since ProfessionalDiagramGenerator may not be available
-        frontend_tech = self._repo_analysis.get('frontend_tech', [])
-        if not frontend_tech:
-            frontend_tech = self._extract_frontend_tech_from_files()
-        
-        component_names = self._extract_real_component_names()
-        components_count = len(component_names) or self._repo_analysis.get('components_total', 0)
-        
-        # Create a simple text diagram
-        tech_str = ', '.join(frontend_tech) if frontend_tech else 'React'
-        
-        diagram = f"""
-┌─────────────────────────────────────┐
-│           Frontend Stack            │
-│         ({tech_str})                │
-├─────────────────────────────────────┤
-│  Components: {components_count:<2}                   │
-│  ┌─────────────────────────────────┐│
-│  │  User Interface Components      ││
-│  │  • Navigation                   ││
-│  │  • Forms & Inputs               ││
-│  │  • Data Display                 ││
-│  └─────────────────────────────────┘│
-│  ┌─────────────────────────────────┐│
-│  │  State Management               ││
-│  │  • Application State            ││
-│  │  • Component State              ││
-│  └─────────────────────────────────┘│
-│  ┌─────────────────────────────────┐│
-│  │  API Communication              ││
-│  │  • HTTP Requests                ││
-│  │  • Data Fetching                ││
-│  └─────────────────────────────────┘│
-└─────────────────────────────────────┘"""
-        
-        return diagram
-    
     def _extract_real_component_names(self) -> List[str]:
         """Extract real component names from repository structure"""
         component_names = []
@@ -534,45 +579,7 @@ class GitHubPDFService:
                         if name and name[0].isupper() and name not in ['App', 'Index', 'Main']:
                             component_names.append(name)
         
-        return list(set(component_names))[:10]  # Return unique names, limit to 10
-    
-    def _extract_frontend_tech_from_files(self) -> List[str]:
-        """Extract frontend technologies from file extensions and package files"""
-        tech = []
-        folder_structure = self._repo_analysis.get('folder_structure', {})
-        
-        has_react = False
-        has_vue = False
-        has_angular = False
-        has_typescript = False
-        
-        for folder, info in folder_structure.items():
-            if isinstance(info, dict) and 'files' in info:
-                for file in info['files']:
-                    if file.endswith(('.jsx', '.tsx')):
-                        has_react = True
-                        if file.endswith('.tsx'):
-                            has_typescript = True
-                    elif file.endswith('.vue'):
-                        has_vue = True
-                    elif file.endswith('.component.ts'):
-                        has_angular = True
-                        has_typescript = True
-                    elif file.endswith('.ts') and not file.endswith('.d.ts'):
-                        has_typescript = True
-        
-        if has_react:
-            tech.append('React')
-        if has_vue:
-            tech.append('Vue.js')
-        if has_angular:
-            tech.append('Angular')
-        if has_typescript:
-            tech.append('TypeScript')
-        elif not tech:  # Default to JavaScript if no specific framework detected
-            tech.append('JavaScript')
-        
-        return tech
+        return list(islice(dict.fromkeys(component_names), 10))  # Return unique names, limit to 10
     
     def _analyze_frontend_structure(self) -> List[str]:
         """Analyze frontend structure and return key insights"""
@@ -613,6 +620,13 @@ class GitHubPDFService:
     
     def _get_comprehensive_api_endpoints(self) -> List[Dict]:
         """Get comprehensive API endpoints from repository, PRD, and frontend analysis"""
+        # Every section asks for the same endpoints - compute them once per report
+        if 'comprehensive_endpoints' not in self._report_cache:
+            self._report_cache['comprehensive_endpoints'] = self._collect_comprehensive_api_endpoints()
+        return list(self._report_cache['comprehensive_endpoints'])
+    
+    def _collect_comprehensive_api_endpoints(self) -> List[Dict]:
+        """Merge repository, PRD and frontend endpoints, de-duplicated by path"""
         all_endpoints = []
         
         # 1. Repository detected endpoints
@@ -669,45 +683,6 @@ class GitHubPDFService:
         
         return endpoints[:8]  # Limit to most relevant
     
-    def _generate_backend_architecture_diagram(self, endpoints: List[Dict]) -> str:
-        """Generate professional backend architecture diagram"""
-        from utils.diagram_generator import ProfessionalDiagramGenerator
-        
-        diagram_gen = ProfessionalDiagramGenerator()
-        frontend_tech = self._repo_analysis.get('frontend_tech', ['React'])
-        backend_tech = self._repo_analysis.get('backend_tech', ['FastAPI'])
-        database_tech = self._repo_analysis.get('database_tech', ['PostgreSQL'])
-        
-        # Create a mock repo analysis for the diagram generator
-        mock_repo = MockRepoAnalysis({
-            'frontend_tech': frontend_tech,
-            'backend_tech': backend_tech,
-            'database_tech': database_tech,
-            'api_endpoints': endpoints
-        })
-        
-        # Generate a simple text-based system diagram
-        diagram = f"""
-┌─────────────────┐    ┌─────────────────┐    ┌─────────────────┐
-│    Frontend     │    │     Backend     │    │    Database     │
-│  {frontend_tech[0]:<13} │◄──►│  {backend_tech[0]:<13} │◄──►│  {database_tech[0]:<13} │
-│                 │    │                 │    │                 │
-│ • UI Components │    │ • API Endpoints │    │ • Data Storage  │
-│ • State Mgmt    │    │ • Business Logic│    │ • Transactions  │
-│ • Routing       │    │ • Authentication│    │ • Indexing      │
-└─────────────────┘    └─────────────────┘    └─────────────────┘
-                              │
-                              ▼
-                    {len(endpoints)} API Endpoints
-                    ┌─────────────────┐
-                    │ RESTful Services│
-                    │ • CRUD Ops      │
-                    │ • Data Validation│
-                    │ • Error Handling│
-                    └─────────────────┘"""
-        
-        return diagram
-    
     def _group_endpoints_by_service(self, endpoints: List[Dict]) -> Dict[str, List[Dict]]:
         """Group endpoints by service/domain"""
         services = {}
@@ -741,7 +716,7 @@ class GitHubPDFService:
         
         # Analyze endpoint patterns
         methods = [ep.get('method', 'GET') for ep in endpoints if isinstance(ep, dict)]
-        method_counts = {method: methods.count(method) for method in set(methods)}
+        method_counts = Counter(methods)
         
         insights.append(f"HTTP methods distribution: {', '.join([f'{k}: {v}' for k, v in method_counts.items()])}")
         
@@ -790,8 +765,8 @@ class GitHubPDFService:
         
         # Extract product name using enhanced method
         product_name = self._extract_enhanced_product_name(cleaned_content)
-        logger.info(f"🔍 DEBUG: Extracted product name: '{product_name}'")
-        logger.info(f"🔍 DEBUG: Cleaned content preview: '{cleaned_content[:200]}...'")
+        logger.debug("🔍 DEBUG: Extracted product name: '%s'", product_name)
+        logger.debug("🔍 DEBUG: Cleaned content preview: '%s...'", cleaned_content[:200])
         
         # Extract tech stack with enhanced patterns
         tech_stack = {'languages': [], 'frontend': [], 'backend': [], 'databases': []}
@@ -899,7 +874,7 @@ class GitHubPDFService:
             'content': cleaned_content
         }
         
-        logger.info(f"🔍 DEBUG: Final PRD parse result - Product: '{result['product_name']}'")
+        logger.debug("🔍 DEBUG: Final PRD parse result - Product: '%s'", result['product_name'])
         return result
     
     def _preprocess_prd_content(self, content: str) -> str:
@@ -954,7 +929,7 @@ class GitHubPDFService:
             matches = re.findall(pattern, content, re.IGNORECASE)
             features.extend([match.strip() for match in matches if len(match.strip()) > 10])
         
-        return list(set(features))[:15]  # Limit and deduplicate
+        return list(islice(dict.fromkeys(features), 15))  # Limit and deduplicate
     
     def _extract_enhanced_api_methods(self, content: str) -> List[str]:
         """Enhanced API method extraction with comprehensive patterns"""
@@ -971,11 +946,11 @@ class GitHubPDFService:
         
         for i, pattern in enumerate(http_patterns):
             matches = re.findall(pattern, content, re.IGNORECASE)
-            logger.info(f"🔍 HTTP pattern {i+1}: Found {len(matches)} matches")
+            logger.debug("🔍 HTTP pattern %s: Found %s matches", i+1, len(matches))
             for match in matches:
                 api_method = f"{match[0]} {match[1]}"
                 api_methods.append(api_method)
-                logger.info(f"✅ Found HTTP method: {api_method}")
+                logger.debug("✅ Found HTTP method: %s", api_method)
         
         # Strategy 2: API endpoint descriptions and paths
         endpoint_patterns = [
@@ -991,11 +966,11 @@ class GitHubPDFService:
         
         for i, pattern in enumerate(endpoint_patterns):
             matches = re.findall(pattern, content, re.IGNORECASE)
-            logger.info(f"🔍 Endpoint pattern {i+1}: Found {len(matches)} matches")
+            logger.debug("🔍 Endpoint pattern %s: Found %s matches", i+1, len(matches))
             for match in matches:
                 if isinstance(match, str) and match.strip():
                     api_methods.append(match.strip())
-                    logger.info(f"✅ Found endpoint: {match.strip()}")
+                    logger.debug("✅ Found endpoint: %s", match.strip())
         
         # Strategy 3: Common API functionality keywords
         api_keywords = [
@@ -1013,7 +988,7 @@ class GitHubPDFService:
         for keyword in api_keywords:
             if keyword in content_lower:
                 api_methods.append(f"API for {keyword} functionality")
-                logger.info(f"✅ Inferred API from keyword '{keyword}': API for {keyword} functionality")
+                logger.debug("✅ Inferred API from keyword '%s': API for %s functionality", keyword, keyword)
         
         # Strategy 4: Look for numbered or bulleted lists that might contain endpoints
         list_patterns = [
@@ -1028,9 +1003,9 @@ class GitHubPDFService:
             for match in matches:
                 if any(keyword in match.lower() for keyword in ['api', 'endpoint', 'service', 'function', 'method']):
                     api_methods.append(match.strip())
-                    logger.info(f"✅ Found from list: {match.strip()}")
+                    logger.debug("✅ Found from list: %s", match.strip())
         
-        unique_methods = list(set(api_methods))[:25]  # Increased limit
+        unique_methods = list(islice(dict.fromkeys(api_methods), 25))  # Increased limit
         logger.info(f"🎯 Total unique API methods extracted: {len(unique_methods)}")
         
         return unique_methods
@@ -1058,7 +1033,7 @@ class GitHubPDFService:
             if entity in content_lower:
                 tables.append(f"{entity}s")  # Pluralize
         
-        return list(set(tables))[:10]  # Limit and deduplicate
+        return list(islice(dict.fromkeys(tables), 10))  # Limit and deduplicate
     
     def _extract_enhanced_goals(self, content: str) -> List[str]:
         """Enhanced goals extraction"""
@@ -1082,7 +1057,7 @@ class GitHubPDFService:
                     if len(match.strip()) > 10:
                         goals.append(match.strip())
         
-        return list(set(goals))[:10]  # Limit and deduplicate
+        return list(islice(dict.fromkeys(goals), 10))  # Limit and deduplicate
     
     def _apply_intelligent_defaults(self, content: str, prd_analysis: Dict) -> Dict:
         """Apply intelligent defaults when PRD parsing yields no results"""
@@ -1237,29 +1212,25 @@ class GitHubPDFService:
         if not github_url:
             return ''
         
-        # Extract repo name from GitHub URL
-        match = re.search(r'github\.com/[^/]+/([^/\.]+)', github_url)
-        if match:
-            repo_name = match.group(1)
-            # Convert repo name to readable title
-            title = re.sub(r'[_-]', ' ', repo_name)
-            
-            # Capitalize words properly
-            words = []
-            for word in title.split():
-                if len(word) > 1:  # Keep words longer than 1 character
-                    words.append(word.capitalize())
-            
-            if words:
-                return ' '.join(words)
-        
-        return ''
+        # Parsed once per URL and memoized across reports
+        return repo_title_from_url(github_url)
 
-    def generate_architecture_pdf(self, architecture, github_url="", prd_included=False, repo_analysis=None, prd_content=None, prd_file_path=None) -> str:
+    def generate_many(self, jobs: List[Dict[str, Any]], max_workers: int = None) -> List[str]:
+        """Render several reports in parallel worker processes, returning PDF paths in job order"""
+        # Layout and matplotlib rendering are CPU-bound Python, so threads would serialize on the GIL.
+        # Spawn rather than fork so workers don't inherit the server's threads and locks
+        jobs = [{'output_dir': self.output_dir, **job} for job in jobs]
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context('spawn')) as pool:
+            return list(pool.map(_render_report_job, jobs))
+    
+    def generate_architecture_pdf(self, architecture, github_url="", prd_included=False, repo_analysis=None, prd_content=None, prd_file_path=None, prd_analysis=None, generated_on=None) -> str:
         """Generate PDF with 100% dynamic content"""
+        # The cover's generation date is an input like any other, so the PDF is a pure function of its arguments
+        generated_on = generated_on or datetime.now().strftime('%Y-%m-%d')
         
         # Store GitHub URL for title extraction
         self._github_url = github_url
+        self._report_cache = {}
         
         # Handle repo_analysis object conversion
         if repo_analysis and hasattr(repo_analysis, '__dict__'):
@@ -1267,8 +1238,10 @@ class GitHubPDFService:
         else:
             self._repo_analysis = {}
         
-        # Handle PRD content - support file path or direct content
-        if prd_content:
+        # Handle PRD content - support pre-parsed analysis, file path or direct content
+        if prd_analysis:
+            self._prd_analysis = prd_analysis
+        elif prd_content:
             self._prd_analysis = self.parse_prd_content(prd_content)
         elif prd_file_path and os.path.exists(prd_file_path):
             try:
@@ -1281,114 +1254,119 @@ class GitHubPDFService:
         else:
             self._prd_analysis = self._get_default_prd_analysis()
         
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # The report is a function of these inputs, so name it by their hash and reuse an earlier render
+        content_key = report_content_key(github_url, prd_included, self._repo_analysis, self._prd_analysis, generated_on)
         product_name = self._prd_analysis.get('product_name', 'Application').replace(' ', '_').replace('/', '_')
         # Use safe filename
-        safe_filename = re.sub(r'[^\w\-_\.]', '_', f"architecture_report_{product_name}_{timestamp}")
+        safe_filename = re.sub(r'[^\w\-_\.]', '_', f"architecture_report_{product_name}_{content_key}")
         filename = f"{safe_filename}.pdf"
         filepath = os.path.join(self.output_dir, filename)
         
+        if os.path.exists(filepath):
+            logger.info(f"♻️ Reusing cached report: {filename}")
+            return filepath
+        
         # Ensure output directory exists and is writable
         os.makedirs(self.output_dir, exist_ok=True)
         
-        doc = SimpleDocTemplate(filepath, pagesize=A4, rightMargin=72, leftMargin=72, topMargin=72, bottomMargin=18)
-        story = []
+        # Build into a temporary file and rename it into place, so a half-written report is never reused
+        fd, tmp_path = tempfile.mkstemp(dir=self.output_dir, suffix='.pdf.tmp')
+        os.close(fd)
+        # mkstemp creates the file owner-only; reports are served as static files
+        os.chmod(tmp_path, 0o644)
+        
+        # Compressed page streams; invariant output has no build timestamp or random file ID,
+        # so identical reports produce identical bytes
+        doc = SimpleDocTemplate(tmp_path, pagesize=A4, rightMargin=72, leftMargin=72, topMargin=72, bottomMargin=18,
+                                pageCompression=1, invariant=1)
+        # Cover page and TOC as one list literal rather than an append per flowable
+        story = [
+            Paragraph(self._get_dynamic_report_title(), self.styles['CustomTitle']),
+            Spacer(1, 0.3*inch),
+            Paragraph(self._get_product_name(), self.styles['CustomHeading1']),
+            Spacer(1, SECTION_GAP),
+            Paragraph(self._get_description(), self.styles['CustomBody']),
+            Spacer(1, 0.3*inch),
+            self._create_cover_table(github_url, prd_included, generated_on),
+            Spacer(1, SECTION_GAP),
+            self._create_stats_table(),
+            PageBreak(),
+            Paragraph("Table of Contents", self.styles['CustomHeading1']),
+            # TOC entries are short fixed lines, so draw them directly instead of one Paragraph each
+            PlainLines(self._get_toc(prd_included).split('\n'), self.styles['CustomBody']),
+            PageBreak(),
+        ]
         
-        # Cover Page - Dynamic
-        story.append(Paragraph(self._get_dynamic_report_title(), self.styles['CustomTitle']))
-        story.append(Spacer(1, 0.3*inch))
-        story.append(Paragraph(self._get_product_name(), self.styles['CustomHeading1']))
-        story.append(Spacer(1, 0.2*inch))
-        story.append(Paragraph(self._get_description(), self.styles['CustomBody']))
-        story.append(Spacer(1, 0.3*inch))
-        story.append(self._create_cover_table(github_url, prd_included))
-        story.append(Spacer(1, 0.2*inch))
-        story.append(self._create_stats_table())
-        story.append(PageBreak())
-        
-        # TOC
-        story.append(Paragraph("Table of Contents", self.styles['CustomHeading1']))
-        
-        # Add each TOC item as separate paragraph for proper vertical formatting
-        toc_items = self._get_toc().split('\n')
-        for item in toc_items:
-            story.append(Paragraph(item, self.styles['CustomBody']))
-        
-        story.append(PageBreak())
-        
-        # All sections with dynamic content
-        story.extend(self._create_executive_summary())
-        story.append(PageBreak())
-        story.extend(self._create_goals_scope())
-        story.append(PageBreak())
-        story.extend(self._create_context_diagram())
-        story.append(PageBreak())
-        story.extend(self._create_frontend_section())
-        story.append(PageBreak())
-        story.extend(self._create_backend_section())
-        story.append(PageBreak())
-        story.extend(self._create_api_section())
-        story.append(PageBreak())
-        story.extend(self._create_sequence_diagram_section())
-        story.append(PageBreak())
-        story.extend(self._create_interactions_section())
-        story.append(PageBreak())
-        story.extend(self._create_unified_diagram())
-        story.append(PageBreak())
-        story.extend(self._create_deployment_section())
-        story.append(PageBreak())
-        story.extend(self._create_security_section())
-        story.append(PageBreak())
-        story.extend(self._create_tech_stack_section())
-        story.append(PageBreak())
+        # All sections with dynamic content, in report order, each on its own page
+        section_builders = [
+            self._create_executive_summary,
+            self._create_goals_scope,
+            self._create_context_diagram,
+            self._create_frontend_section,
+            self._create_backend_section,
+            self._create_api_section,
+            self._create_sequence_diagram_section,
+            self._create_interactions_section,
+            self._create_unified_diagram,
+            self._create_deployment_section,
+            self._create_security_section,
+            self._create_tech_stack_section,
+        ]
         if prd_included:
-            story.extend(self._create_business_alignment())
-            story.append(PageBreak())
-        story.extend(self._create_recommendations_section())
-        story.append(PageBreak())
-        
-        # Add system architecture diagram
-        story.extend(self._create_architecture_diagram_section())
-        story.append(PageBreak())
+            section_builders.append(self._create_business_alignment)
+        section_builders.extend([
+            self._create_recommendations_section,
+            # System architecture diagram
+            self._create_architecture_diagram_section,
+            # Layered data flow diagram
+            self._create_layered_dataflow_section,
+        ])
         
-        # Add layered data flow diagram
-        story.extend(self._create_layered_dataflow_section())
+        for index, build_section in enumerate(section_builders):
+            if index:
+                story.append(PageBreak())
+            story.extend(build_section())
         
-        doc.build(story)
+        try:
+            doc.build(story)
+            os.replace(tmp_path, filepath)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
         return filepath
 
     # Dynamic content methods
     def _get_product_name(self) -> str:
         product_name = self._prd_analysis.get('product_name', 'Application')
-        logger.info(f"🔍 DEBUG: Raw product_name from PRD analysis: '{product_name}'")
-        logger.info(f"🔍 DEBUG: PRD analysis keys: {list(self._prd_analysis.keys()) if self._prd_analysis else 'None'}")
+        logger.debug("🔍 DEBUG: Raw product_name from PRD analysis: '%s'", product_name)
+        logger.debug("🔍 DEBUG: PRD analysis keys: %s", list(self._prd_analysis.keys()) if self._prd_analysis else 'None')
         
         # Clean up corrupted product names
         if product_name.startswith('%PDF') or 'PDF-1.' in product_name:
-            logger.info(f"🔍 DEBUG: Detected corrupted PDF product name, using fallback")
+            logger.debug("🔍 DEBUG: Detected corrupted PDF product name, using fallback")
             return 'Web Application'
         
         # Always use the extracted product name if it's not the default
         if product_name and product_name != 'Application':
-            logger.info(f"🔍 DEBUG: Using extracted product name: '{product_name}'")
+            logger.debug("🔍 DEBUG: Using extracted product name: '%s'", product_name)
             return product_name
         
-        logger.info(f"🔍 DEBUG: Using default 'Application' name")
+        logger.debug("🔍 DEBUG: Using default 'Application' name")
         return 'Application'
     
     def _extract_enhanced_product_name(self, prd_content: str) -> str:
         """Enhanced product name extraction from PRD content"""
         if not prd_content:
-            logger.info(f"🔍 DEBUG: No PRD content provided")
+            logger.debug("🔍 DEBUG: No PRD content provided")
             return "Application"
         
         lines = prd_content.strip().split('\n')
-        logger.info(f"🔍 DEBUG: Processing {len(lines)} lines for product name")
+        logger.debug("🔍 DEBUG: Processing %s lines for product name", len(lines))
         
         # Look for title patterns in first 10 lines
         for i, line in enumerate(lines[:10]):
             cleaned_line = line.strip()
-            logger.info(f"🔍 DEBUG: Line {i+1}: '{cleaned_line[:100]}...'")
+            logger.debug("🔍 DEBUG: Line %s: '%s...'", i+1, cleaned_line[:100])
             
             # Skip empty lines
             if not cleaned_line:
@@ -1401,11 +1379,11 @@ class GitHubPDFService:
             cleaned_line = re.sub(r'[\x00-\x1f\x7f-\x9f]', ' ', cleaned_line)  # Remove control chars
             cleaned_line = re.sub(r'\s+', ' ', cleaned_line).strip()  # Normalize whitespace
             
-            logger.info(f"🔍 DEBUG: Cleaned line {i+1}: '{cleaned_line}'")
+            logger.debug("🔍 DEBUG: Cleaned line %s: '%s'", i+1, cleaned_line)
             
             # Skip metadata lines
             if re.match(r'^(Page|Document|Version|Prepared|Table|Product Requirements|PRD|Contents?)\b', cleaned_line, re.IGNORECASE):
-                logger.info(f"🔍 DEBUG: Skipping metadata line: '{cleaned_line}'")
+                logger.debug("🔍 DEBUG: Skipping metadata line: '%s'", cleaned_line)
                 continue
             
             # Look for application/system/platform keywords that indicate a title
@@ -1415,17 +1393,17 @@ class GitHubPDFService:
             has_keyword = any(keyword in cleaned_line.lower() for keyword in title_keywords)
             matches_pattern = re.match(r'^[A-Z][a-zA-Z\s]+[A-Za-z]$', cleaned_line)
             
-            logger.info(f"🔍 DEBUG: Line '{cleaned_line}' - Length: {len(cleaned_line)}, Has keyword: {has_keyword}, Matches pattern: {bool(matches_pattern)}")
+            logger.debug("🔍 DEBUG: Line '%s' - Length: %s, Has keyword: %s, Matches pattern: %s", cleaned_line, len(cleaned_line), has_keyword, bool(matches_pattern))
             
             if (len(cleaned_line) > 3 and 
                 len(cleaned_line) < 100 and  # Reasonable title length
                 not re.match(r'^\d+\.?\s*$', cleaned_line) and  # Not just numbers
                 not cleaned_line.lower().startswith(('by:', 'author:', 'date:', 'overview')) and
                 (has_keyword or matches_pattern)):
-                logger.info(f"🔍 DEBUG: FOUND PRODUCT NAME: '{cleaned_line}'")
+                logger.debug("🔍 DEBUG: FOUND PRODUCT NAME: '%s'", cleaned_line)
                 return cleaned_line
         
-        logger.info(f"🔍 DEBUG: No product name found, using default 'Application'")
+        logger.debug("🔍 DEBUG: No product name found, using default 'Application'")
         return "Application"
 
     def _get_description(self) -> str:
@@ -1486,7 +1464,7 @@ class GitHubPDFService:
         else:
             return "Basic Scalability"
 
-    def _create_cover_table(self, github_url: str, prd_included: bool) -> Table:
+    def _create_cover_table(self, github_url: str, prd_included: bool, generated_on: str) -> Table:
         file_count = self._repo_analysis.get('file_count', 0)
         
         # Determine analysis type based on actual detected technologies
@@ -1522,11 +1500,11 @@ class GitHubPDFService:
             ['Generated from:', 'GitHub Repository Analysis'],
             ['Repository URL:', github_url or 'Local Analysis'],
             ['PRD Analysis:', 'Included' if prd_included else 'Not Provided'],
-            ['Generated on:', datetime.now().strftime('%Y-%m-%d %H:%M:%S')],
+            ['Generated on:', generated_on],
             ['Analysis Scope:', scope_text]
         ]
         
-        table = Table(data, colWidths=[2*inch, 4*inch])
+        table = Table(data, colWidths=KEY_VALUE_COL_WIDTHS)
         table.setStyle(TableStyle([
             ('BACKGROUND', (0, 0), (0, -1), self.colors['light_gray']),
             ('TEXTCOLOR', (0, 0), (-1, -1), self.colors['text']),
@@ -1547,7 +1525,7 @@ class GitHubPDFService:
             ['Technology Maturity:', 'Modern' if self._repo_analysis.get('build_tools') else 'Standard']
         ]
         
-        table = Table(data, colWidths=[2*inch, 4*inch])
+        table = Table(data, colWidths=KEY_VALUE_COL_WIDTHS)
         table.setStyle(TableStyle([
             ('BACKGROUND', (0, 0), (0, -1), self.colors['primary']),
             ('TEXTCOLOR', (0, 0), (0, -1), white),
@@ -1560,7 +1538,7 @@ class GitHubPDFService:
         
         return table
 
-    def _get_toc(self) -> str:
+    def _get_toc(self, prd_included: bool = True) -> str:
         toc_items = [
             "1. Executive Summary",
             "2. Architecture Goals & Scope", 
@@ -1578,6 +1556,9 @@ class GitHubPDFService:
             "14. Recommendations & Next Steps",
             "15. System Architecture Diagram"
         ]
+        if not prd_included:
+            # Business alignment is only rendered when a PRD was supplied
+            toc_items.remove("13. Business Alignment")
         return "\n".join(toc_items)
 
     def _create_executive_summary(self) -> List:
@@ -1585,10 +1566,10 @@ class GitHubPDFService:
         story.append(Paragraph("1. Executive Summary", self.styles['CustomHeading1']))
         
         # Debug what we actually have
-        logger.info(f"🔍 DEBUG - repo_analysis keys: {list(self._repo_analysis.keys()) if self._repo_analysis else 'None'}")
-        logger.info(f"🔍 DEBUG - prd_analysis keys: {list(self._prd_analysis.keys()) if self._prd_analysis else 'None'}")
-        logger.info(f"🔍 DEBUG - repo_analysis content: {self._repo_analysis}")
-        logger.info(f"🔍 DEBUG - prd_analysis content: {self._prd_analysis}")
+        logger.debug("🔍 DEBUG - repo_analysis keys: %s", list(self._repo_analysis.keys()) if self._repo_analysis else 'None')
+        logger.debug("🔍 DEBUG - prd_analysis keys: %s", list(self._prd_analysis.keys()) if self._prd_analysis else 'None')
+        logger.debug("🔍 DEBUG - repo_analysis content: %s", self._repo_analysis)
+        logger.debug("🔍 DEBUG - prd_analysis content: %s", self._prd_analysis)
         
         # Get actual detected values with intelligent inference
         prd_endpoints = self._extract_prd_endpoints()
@@ -1617,10 +1598,10 @@ class GitHubPDFService:
             language_count = len(inferred_languages)
         
         logger.info(f"🔍 RAW COUNTS - APIs: {api_count}, Frontend: {frontend_count}, Backend: {backend_count}, Languages: {language_count}")
-        logger.info(f"🔍 PRD endpoints: {prd_endpoints}")
-        logger.info(f"🔍 Repo endpoints: {repo_endpoints}")
-        logger.info(f"🔍 Backend tech: {backend_tech}")
-        logger.info(f"🔍 Languages: {languages}")
+        logger.debug("🔍 PRD endpoints: %s", prd_endpoints)
+        logger.debug("🔍 Repo endpoints: %s", repo_endpoints)
+        logger.debug("🔍 Backend tech: %s", backend_tech)
+        logger.debug("🔍 Languages: %s", languages)
         
         # Executive summary text
         summary_text = f"This document presents a comprehensive analysis of the {self._get_product_name()} architecture, generated through automated analysis of the GitHub repository and associated documentation."
@@ -1629,7 +1610,7 @@ class GitHubPDFService:
         else:
             summary_text += " Backend components detected and analyzed."
         story.append(Paragraph(summary_text, self.styles['CustomBody']))
-        story.append(Spacer(1, 0.2*inch))
+        story.append(Spacer(1, SECTION_GAP))
         
         # Key findings with actual detected values
         story.append(Paragraph("Key Findings:", self.styles['CustomHeading2']))
@@ -1643,7 +1624,7 @@ class GitHubPDFService:
         ]
         
         for finding in findings:
-            story.append(Paragraph(finding, self.styles['CustomBullet']))
+            story.append(self._para(finding, 'CustomBullet'))
         
         return story
     
@@ -1830,6 +1811,12 @@ class GitHubPDFService:
     
     def _extract_prd_endpoints(self) -> List[Dict]:
         """Extract specific API endpoints mentioned in PRD"""
+        if 'prd_endpoints' not in self._report_cache:
+            self._report_cache['prd_endpoints'] = self._parse_prd_endpoints()
+        return list(self._report_cache['prd_endpoints'])
+    
+    def _parse_prd_endpoints(self) -> List[Dict]:
+        """Scan the PRD text for endpoint paths and entity CRUD endpoints"""
         endpoints = []
         prd_content = self._prd_analysis.get('content', '')
         
@@ -1863,9 +1850,12 @@ class GitHubPDFService:
         
         # Generate CRUD endpoints for database entities
         entities = self._extract_entities_from_prd(prd_content)
+        resources = {ep['path'].split('/')[-1] for ep in endpoints}
         for entity in entities:
-            if entity not in [ep['path'].split('/')[-1] for ep in endpoints]:
-                endpoints.extend(self._generate_entity_endpoints(entity))
+            if entity not in resources:
+                entity_endpoints = self._generate_entity_endpoints(entity)
+                endpoints.extend(entity_endpoints)
+                resources.update(ep['path'].split('/')[-1] for ep in entity_endpoints)
         
         return endpoints
     
@@ -1963,8 +1953,7 @@ class GitHubPDFService:
                 "Enable cross-platform compatibility and performance"
             ])
         
-        for goal in goals[:5]:
-            story.append(Paragraph(f"• {self._sanitize_text(goal)}", self.styles['CustomBullet']))
+        story.extend(self._bullet_table(self._sanitize_text(goal) for goal in list(islice(dict.fromkeys(goals), 5))))
         
         return story
 
@@ -1975,7 +1964,7 @@ class GitHubPDFService:
         # Context description
         context_text = "The following diagram illustrates the high-level context of the system, showing how users interact with the frontend, which communicates with backend services, and how data flows to external systems and databases."
         story.append(Paragraph(context_text, self.styles['CustomBody']))
-        story.append(Spacer(1, 0.2*inch))
+        story.append(Spacer(1, SECTION_GAP))
         
         try:
             # Generate visual context flow diagram
@@ -1995,7 +1984,7 @@ class GitHubPDFService:
             if os.path.exists(diagram_path):
                 img = Image(diagram_path, width=6.5*inch, height=4.5*inch)
                 story.append(img)
-                story.append(Spacer(1, 0.2*inch))
+                story.append(Spacer(1, SECTION_GAP))
         except Exception as e:
             logger.error(f"Failed to generate context diagram: {str(e)}")
             story.append(Paragraph("Context diagram generation failed.", self.styles['CustomBody']))
@@ -2003,8 +1992,7 @@ class GitHubPDFService:
         # System boundaries
         story.append(Paragraph("System Boundaries:", self.styles['CustomHeading2']))
         fallback_boundaries = self._get_fallback_boundaries()
-        for boundary in fallback_boundaries:
-            story.append(Paragraph(f"• {boundary}", self.styles['CustomBullet']))
+        story.extend(self._bullet_table(fallback_boundaries))
         
         return story
 
@@ -2022,7 +2010,7 @@ class GitHubPDFService:
         components_count = self._repo_analysis.get('components_total', 0)
         story.append(Paragraph(f"Total Components: {components_count}", self.styles['CustomBody']))
         story.append(Paragraph(f"Total Pages: {self._repo_analysis.get('pages_total', 0)}", self.styles['CustomBody']))
-        story.append(Spacer(1, 0.2*inch))
+        story.append(Spacer(1, SECTION_GAP))
         
         try:
             # Generate visual frontend architecture diagram
@@ -2040,7 +2028,7 @@ class GitHubPDFService:
             if os.path.exists(diagram_path):
                 img = Image(diagram_path, width=6.5*inch, height=5.5*inch)
                 story.append(img)
-                story.append(Spacer(1, 0.2*inch))
+                story.append(Spacer(1, SECTION_GAP))
         except Exception as e:
             logger.error(f"Failed to generate frontend diagram: {str(e)}")
             story.append(Paragraph("Frontend diagram generation failed.", self.styles['CustomBody']))
@@ -2049,8 +2037,7 @@ class GitHubPDFService:
         component_structure = self._analyze_frontend_structure()
         if component_structure:
             story.append(Paragraph("Component Structure:", self.styles['CustomHeading2']))
-            for item in component_structure:
-                story.append(Paragraph(f"• {item}", self.styles['CustomBullet']))
+            story.extend(self._bullet_table(component_structure))
         
         return story
 
@@ -2081,15 +2068,13 @@ class GitHubPDFService:
                     method = endpoint.get('method', 'GET')
                     path = endpoint.get('path', '/')
                     purpose = endpoint.get('purpose', '')
-                    story.append(Paragraph(f"• {method} {path}", self.styles['CustomBullet']))
+                    story.append(self._para(f"• {method} {path}", 'CustomBullet'))
                     if purpose:
                         story.append(Paragraph(f"  Purpose: {purpose}", self.styles['CustomBody']))
                 else:
-                    story.append(Paragraph(f"• {endpoint}", self.styles['CustomBullet']))
-        else:
-            story.append(Paragraph("No API endpoints detected in repository or PRD", self.styles['CustomBody']))
+                    story.append(self._para(f"• {endpoint}", 'CustomBullet'))
         
-        story.append(Spacer(1, 0.2*inch))
+        story.append(Spacer(1, SECTION_GAP))
         
         try:
             # Generate visual backend architecture diagram
@@ -2107,7 +2092,7 @@ class GitHubPDFService:
             if os.path.exists(diagram_path):
                 img = Image(diagram_path, width=6.5*inch, height=5.5*inch)
                 story.append(img)
-                story.append(Spacer(1, 0.2*inch))
+                story.append(Spacer(1, SECTION_GAP))
         except Exception as e:
             logger.error(f"Failed to generate backend diagram: {str(e)}")
             story.append(Paragraph("Backend diagram generation failed.", self.styles['CustomBody']))
@@ -2116,8 +2101,7 @@ class GitHubPDFService:
         service_analysis = self._analyze_backend_services(all_endpoints)
         if service_analysis:
             story.append(Paragraph("Service Layer Analysis:", self.styles['CustomHeading2']))
-            for item in service_analysis:
-                story.append(Paragraph(f"• {item}", self.styles['CustomBullet']))
+            story.extend(self._bullet_table(service_analysis))
         
         return story
 
@@ -2138,14 +2122,13 @@ class GitHubPDFService:
             for endpoint in repo_endpoints:
                 method = endpoint.get('method', 'GET')
                 path = endpoint.get('path', '/')
-                story.append(Paragraph(f"• {method} {path}", self.styles['CustomBullet']))
+                story.append(self._para(f"• {method} {path}", 'CustomBullet'))
                 story.append(Paragraph(f"  Description: {endpoint.get('description', 'No description')}", self.styles['CustomBody']))
         
         # PRD specified APIs
         if prd_apis:
             story.append(Paragraph("PRD Specified APIs:", self.styles['CustomHeading2']))
-            for api in prd_apis:
-                story.append(Paragraph(f"• {self._sanitize_text(api)}", self.styles['CustomBullet']))
+            story.extend(self._bullet_table(self._sanitize_text(api) for api in prd_apis))
         
         # Inferred endpoints with detailed specifications
         if inferred_endpoints:
@@ -2157,7 +2140,7 @@ class GitHubPDFService:
                 
                 # Request fields table
                 if endpoint.get('request_fields'):
-                    story.append(Paragraph("Request Fields:", self.styles['CustomBullet']))
+                    story.append(self._para("Request Fields:", 'CustomBullet'))
                     req_data = [['Field', 'Type', 'Required', 'Description']]
                     for field, details in endpoint['request_fields'].items():
                         req_data.append([
@@ -2167,7 +2150,7 @@ class GitHubPDFService:
                             details.get('description', 'No description')
                         ])
                     
-                    req_table = Table(req_data, colWidths=[1.2*inch, 0.8*inch, 0.7*inch, 2.8*inch])
+                    req_table = Table(req_data, colWidths=REQUEST_FIELD_COL_WIDTHS)
                     req_table.setStyle(TableStyle([
                         ('BACKGROUND', (0, 0), (-1, 0), self.colors['light_gray']),
                         ('TEXTCOLOR', (0, 0), (-1, 0), self.colors['text']),
@@ -2180,7 +2163,7 @@ class GitHubPDFService:
                 
                 # Response fields table
                 if endpoint.get('response_fields'):
-                    story.append(Paragraph("Response Fields:", self.styles['CustomBullet']))
+                    story.append(self._para("Response Fields:", 'CustomBullet'))
                     resp_data = [['Field', 'Type', 'Description']]
                     for field, details in endpoint['response_fields'].items():
                         resp_data.append([
@@ -2189,7 +2172,7 @@ class GitHubPDFService:
                             details.get('description', 'No description')
                         ])
                     
-                    resp_table = Table(resp_data, colWidths=[1.5*inch, 1*inch, 3*inch])
+                    resp_table = Table(resp_data, colWidths=RESPONSE_FIELD_COL_WIDTHS)
                     resp_table.setStyle(TableStyle([
                         ('BACKGROUND', (0, 0), (-1, 0), self.colors['medium_gray']),
                         ('TEXTCOLOR', (0, 0), (-1, 0), self.colors['text']),
@@ -2200,7 +2183,7 @@ class GitHubPDFService:
                     ]))
                     story.append(resp_table)
                 
-                story.append(Spacer(1, 0.15*inch))
+                story.append(Spacer(1, ENDPOINT_GAP))
         
         # Summary
         total_endpoints = len(repo_endpoints) + len(prd_apis) + len(inferred_endpoints)
@@ -2208,103 +2191,6 @@ class GitHubPDFService:
         
         return story
 
-    def _create_data_flow_section(self) -> List:
-        story = []
-        
-        # Get dynamic project title
-        project_title = self._get_dynamic_project_title()
-        story.append(Paragraph(f"7. {project_title} - Sequence Diagram", self.styles['CustomHeading1']))
-        
-        # Generate dynamic sequence diagram based on detected entities and APIs
-        sequence_diagram = self._generate_dynamic_sequence_diagram()
-        story.append(Paragraph("System Interaction Flow:", self.styles['CustomHeading2']))
-        # Split diagram into lines and add each as separate paragraph to preserve formatting
-        diagram_lines = sequence_diagram.strip().split('\n')
-        for line in diagram_lines:
-            story.append(Paragraph(line, self.styles['PlainASCII']))
-        
-        # Add flow analysis
-        flow_analysis = self._analyze_system_flow()
-        if flow_analysis:
-            story.append(Paragraph("Flow Analysis:", self.styles['CustomHeading2']))
-            for item in flow_analysis:
-                story.append(Paragraph(f"• {item}", self.styles['CustomBullet']))
-        
-        return story
-    
-    def _get_dynamic_project_title(self) -> str:
-        """Get dynamic project title from GitHub URL or PRD document"""
-        # Try to get from PRD first
-        prd_title = self._prd_analysis.get('product_name', '')
-        if prd_title and prd_title != 'Application' and not prd_title.startswith('%PDF'):
-            return prd_title
-        
-        # Fallback to generic title
-        return "System Architecture"
-    
-    def _generate_dynamic_sequence_diagram(self) -> str:
-        """Generate dynamic sequence diagram in professional ASCII art style with real data"""
-        # Extract real data
-        entities = self._extract_entities_from_prd(self._prd_analysis.get('content', ''))
-        endpoints = self._get_comprehensive_api_endpoints()
-        
-        # Get system components with safe access
-        frontend_tech_list = self._repo_analysis.get('frontend_tech', [])
-        backend_tech_list = self._repo_analysis.get('backend_tech', [])
-        database_tech_list = self._repo_analysis.get('database_tech', [])
-        
-        # Safe access with fallback defaults
-        frontend_tech = frontend_tech_list[0] if frontend_tech_list else 'React'
-        backend_tech = backend_tech_list[0] if backend_tech_list else 'Python FastAPI'
-        database_tech = database_tech_list[0] if database_tech_list else 'PostgreSQL'
-        
-        # Determine main entity for flow
-        main_entity = entities[0] if entities else 'data'
-        
-        # Get product name for title
-        product_name = self._get_product_name()
-        
-        # Generate professional ASCII art sequence diagram
-        diagram = f"""{product_name} - {main_entity.title()} Management Sequence Diagram (List + Create {main_entity.title()})
-
-+-----------+     +-------------------+     +-------------------+     +-------------+
-|   User    |     |    Frontend       |     |     Backend       |     |  Database   |
-| (Browser) |     | ({frontend_tech:<15}) |     | ({backend_tech:<15}) |     | ({database_tech:<9})|
-+-----------+     +-------------------+     +-------------------+     +-------------+
-    |                   |                         |                         |
-    | 1. Navigate to      |                         |                         |
-    |    {main_entity} page        |                         |                         |
-    |-------------------->|                         |                         |
-    |                   |                         |                         |
-    |                   | 2. GET /api/{main_entity}    |                         |
-    |                   |------------------------>|                         |
-    |                   |                         | 3. SELECT * FROM {main_entity}
-    |                   |                         |------------------------>|
-    |                   |                         |<------------------------|
-    |                   |                         | 4. Return records       |
-    |                   |<------------------------|                         |
-    |                   | 5. 200 OK + JSON        |                         |
-    |<--------------------|                         |                         |
-    | 6. Display {main_entity} list |                         |                         |
-    |                   |                         |                         |
-    | 7. Click "Create"   |                         |                         |
-    |-------------------->|                         |                         |
-    |                   |                         |                         |
-    |                   | 8. POST /api/{main_entity}   |                         |
-    |                   | {{name, desc...}}        |                         |
-    |                   |------------------------>|                         |
-    |                   |                         | 9. INSERT INTO {main_entity}
-    |                   |                         |------------------------>|
-    |                   |                         |<------------------------|
-    |                   |                         | 10. Return new ID       |
-    |                   |<------------------------|                         |
-    |                   | 11. 201 Created + JSON  |                         |
-    |<--------------------|                         |                         |
-    | 12. Success message |                         |                         |
-    |    & update UI      |                         |                         |"""
-        
-        return diagram
-    
     def _generate_entity_flow_steps(self, entity: str, endpoints: List[Dict], actors: List[str]) -> List[Dict]:
         """Generate flow steps based on main entity (hotel, booking, etc.)"""
         entity_endpoints = [ep for ep in endpoints if isinstance(ep, dict) and entity in ep.get('path', '').lower()]
@@ -2352,46 +2238,12 @@ class GitHubPDFService:
             {'from_idx': 1, 'to_idx': 0, 'message': 'Show success', 'description': 'Frontend displays confirmation'}
         ]
     
-    def _analyze_system_flow(self) -> List[str]:
-        """Analyze system flow and return insights"""
-        flow_insights = []
-        
-        # Analyze endpoints for flow patterns
-        endpoints = self._get_comprehensive_api_endpoints()
-        
-        if not endpoints:
-            flow_insights.append("No API endpoints detected - static frontend application")
-            return flow_insights
-        
-        # Authentication flow analysis
-        auth_endpoints = [ep for ep in endpoints if isinstance(ep, dict) and 
-                         ('auth' in ep.get('path', '').lower() or 'login' in ep.get('path', '').lower())]
-        if auth_endpoints:
-            flow_insights.append(f"Authentication flow: {len(auth_endpoints)} auth-related endpoints")
-        
-        # Data flow analysis
-        data_endpoints = [ep for ep in endpoints if isinstance(ep, dict) and 
-                         ep.get('method') in ['GET', 'POST', 'PUT', 'DELETE']]
-        if data_endpoints:
-            methods = [ep.get('method') for ep in data_endpoints]
-            flow_insights.append(f"Data flow operations: {', '.join(set(methods))}")
-        
-        # Frontend-backend communication
-        frontend_tech = self._repo_analysis.get('frontend_tech', [])
-        backend_tech = self._repo_analysis.get('backend_tech', [])
-        if frontend_tech and backend_tech:
-            flow_insights.append(f"Communication: {frontend_tech[0]} ↔ {backend_tech[0]} via REST API")
-        
-        return flow_insights
-
     def _create_interactions_section(self) -> List:
         story = []
         story.append(Paragraph("8. Component Interactions", self.styles['CustomHeading1']))
         
         story.append(Paragraph("Communication Patterns:", self.styles['CustomHeading2']))
-        story.append(Paragraph("• RESTful API communication", self.styles['CustomBullet']))
-        story.append(Paragraph("• JSON data exchange", self.styles['CustomBullet']))
-        story.append(Paragraph("• HTTP/HTTPS protocols", self.styles['CustomBullet']))
+        story.append(self._bullet_block(["RESTful API communication", "JSON data exchange", "HTTP/HTTPS protocols"]))
         
         return story
 
@@ -2406,35 +2258,22 @@ class GitHubPDFService:
         database = ', '.join(self._repo_analysis.get('database_tech', ['PostgreSQL', 'SQLAlchemy']))
         build_tools = ', '.join(self._repo_analysis.get('build_tools', ['npm/yarn']))
         
-        story.append(Paragraph(f"• Frontend: {frontend}", self.styles['CustomBullet']))
-        story.append(Paragraph(f"• Backend: {backend}", self.styles['CustomBullet']))
-        story.append(Paragraph(f"• Database: {database}", self.styles['CustomBullet']))
+        summary = [f"Frontend: {frontend}", f"Backend: {backend}", f"Database: {database}"]
         if build_tools != 'npm/yarn':
-            story.append(Paragraph(f"• Build Tools: {build_tools}", self.styles['CustomBullet']))
+            summary.append(f"Build Tools: {build_tools}")
+        story.append(self._bullet_block(summary))
         
         # Enhanced database details
         story.append(Paragraph("Database Details:", self.styles['CustomHeading2']))
         db_details = self._generate_enhanced_database_details()
-        for detail in db_details:
-            story.append(Paragraph(f"• {detail}", self.styles['CustomBullet']))
+        story.extend(self._bullet_table(db_details))
         
-        # Comprehensive database tables with full schema based on API endpoints
-        story.append(Paragraph("Database Tables (Based on Detected API Endpoints):", self.styles['CustomHeading2']))
+        # Comprehensive database tables with full schema based on API endpoints; omitted when none were found
         table_schemas = self._generate_comprehensive_table_schemas()
-        
         if table_schemas:
-            for schema_line in table_schemas:
-                if schema_line.startswith('  -') or schema_line.startswith('    -'):
-                    # Field definitions and indexes
-                    story.append(Paragraph(f"• {schema_line.strip()}", self.styles['CustomBullet']))
-                elif schema_line.strip().endswith('Indexes:'):
-                    # Index section header
-                    story.append(Paragraph(f"• {schema_line.strip()}", self.styles['CustomBullet']))
-                else:
-                    # Table headers
-                    story.append(Paragraph(f"• {schema_line}", self.styles['CustomBullet']))
-        else:
-            story.append(Paragraph("• No database tables detected from API endpoints", self.styles['CustomBullet']))
+            story.append(Paragraph("Database Tables (Based on Detected API Endpoints):", self.styles['CustomHeading2']))
+            # Table headers, field definitions and index lines; leading indentation collapses in a Paragraph anyway
+            story.append(self._bullet_block(schema_line.strip() for schema_line in table_schemas))
         
         return story
     
@@ -2476,7 +2315,7 @@ class GitHubPDFService:
         prd_tables = self._prd_analysis.get('database_tables', [])
         
         # Merge and prioritize API-based entities
-        all_entities = list(set(entities_from_apis + prd_tables))
+        all_entities = list(dict.fromkeys(entities_from_apis + prd_tables))
         
         # If no entities found, use intelligent defaults
         if not all_entities:
@@ -2763,8 +2602,7 @@ class GitHubPDFService:
             "Monitoring Setup: Recommended"
         ]
         
-        for item in config:
-            story.append(Paragraph(f"• {item}", self.styles['CustomBullet']))
+        story.extend(self._bullet_table(config))
         
         return story
 
@@ -2781,8 +2619,7 @@ class GitHubPDFService:
             "Regular security audits"
         ]
         
-        for rec in recommendations:
-            story.append(Paragraph(f"• {rec}", self.styles['CustomBullet']))
+        story.extend(self._bullet_table(recommendations))
         
         return story
 
@@ -2794,22 +2631,19 @@ class GitHubPDFService:
         frontend = self._repo_analysis.get('frontend_tech', [])
         if frontend:
             story.append(Paragraph("Frontend Technologies:", self.styles['CustomHeading2']))
-            for tech in frontend:
-                story.append(Paragraph(f"• {tech}", self.styles['CustomBullet']))
+            story.extend(self._bullet_table(frontend))
         
         # Backend technologies
         backend = self._repo_analysis.get('backend_tech', [])
         if backend:
             story.append(Paragraph("Backend Technologies:", self.styles['CustomHeading2']))
-            for tech in backend:
-                story.append(Paragraph(f"• {tech}", self.styles['CustomBullet']))
+            story.extend(self._bullet_table(backend))
         
         # Database technologies
         database = self._repo_analysis.get('database_tech', [])
         if database:
             story.append(Paragraph("Database Technologies:", self.styles['CustomHeading2']))
-            for tech in database:
-                story.append(Paragraph(f"• {tech}", self.styles['CustomBullet']))
+            story.extend(self._bullet_table(database))
         
         return story
 
@@ -2821,8 +2655,7 @@ class GitHubPDFService:
         features = self._prd_analysis.get('features', [])
         if features:
             story.append(Paragraph("Key Features (from PRD):", self.styles['CustomHeading2']))
-            for feature in features:
-                story.append(Paragraph(f"• {self._sanitize_text(feature)}", self.styles['CustomBullet']))
+            story.extend(self._bullet_table(self._sanitize_text(feature) for feature in features))
         
         return story
 
@@ -2882,20 +2715,19 @@ class GitHubPDFService:
             # Add diagram description
             story.append(Paragraph("System Architecture Overview:", self.styles['CustomHeading2']))
             story.append(Paragraph("The following diagram shows the complete system architecture with real components, API endpoints, and data flow based on the analyzed repository and PRD.", self.styles['CustomBody']))
-            story.append(Spacer(1, 0.2*inch))
+            story.append(Spacer(1, SECTION_GAP))
             
             # Add diagram to PDF
             from reportlab.platypus import Image
             if os.path.exists(diagram_path):
                 img = Image(diagram_path, width=6*inch, height=4.3*inch)
                 story.append(img)
-                story.append(Spacer(1, 0.2*inch))
+                story.append(Spacer(1, SECTION_GAP))
             
             # Add diagram insights
             story.append(Paragraph("Architecture Insights:", self.styles['CustomHeading2']))
             insights = self._generate_architecture_insights(endpoints)
-            for insight in insights:
-                story.append(Paragraph(f"• {insight}", self.styles['CustomBullet']))
+            story.extend(self._bullet_table(insights))
                 
         except Exception as e:
             logger.error(f"Failed to generate architecture diagram: {str(e)}")
@@ -2926,14 +2758,14 @@ class GitHubPDFService:
                 f"detected from the repository analysis and PRD document.",
                 self.styles['CustomBody']
             ))
-            story.append(Spacer(1, 0.2*inch))
+            story.append(Spacer(1, SECTION_GAP))
             
             # Add diagram to PDF
             from reportlab.platypus import Image
             if os.path.exists(diagram_path):
                 img = Image(diagram_path, width=7*inch, height=5*inch)
                 story.append(img)
-                story.append(Spacer(1, 0.2*inch))
+                story.append(Spacer(1, SECTION_GAP))
             
             # Add layer descriptions
             story.append(Paragraph("Architecture Layers Explained:", self.styles['CustomHeading2']))
@@ -2949,9 +2781,7 @@ class GitHubPDFService:
                 "<b>External Systems:</b> Third-party APIs and external services integrated with the application."
             ]
             
-            for desc in layer_descriptions:
-                story.append(Paragraph(f"• {desc}", self.styles['CustomBullet']))
-                story.append(Spacer(1, 0.05*inch))
+            story.extend(self._bullet_table(layer_descriptions))
                 
         except Exception as e:
             logger.error(f"Failed to generate layered dataflow diagram: {str(e)}")
@@ -3039,18 +2869,19 @@ class GitHubPDFService:
                 # Prefer entities that appear in both PRD and endpoints
                 prd_entities = {e for e in entity_candidates if any(e.lower() in f.lower() for f in prd_features) or e.lower() in prd_content}
                 
+                # Candidates are sets, so pick alphabetically rather than in hash-seed order
                 if prd_entities and endpoint_entities:
                     # Best case: entity in both PRD and endpoints
                     common = prd_entities.intersection(endpoint_entities)
                     if common:
-                        selected_entity = list(common)[0]
+                        selected_entity = min(common)
                     else:
                         # Use PRD entity if available
-                        selected_entity = list(prd_entities)[0]
+                        selected_entity = min(prd_entities)
                 elif endpoint_entities:
-                    selected_entity = list(endpoint_entities)[0]
+                    selected_entity = min(endpoint_entities)
                 else:
-                    selected_entity = list(entity_candidates)[0]
+                    selected_entity = min(entity_candidates)
             
             # Fallback: Use product name or generic
             if not selected_entity:
@@ -3092,7 +2923,7 @@ class GitHubPDFService:
             if os.path.exists(diagram_path):
                 img = Image(diagram_path, width=7*inch, height=5*inch)
                 story.append(img)
-                story.append(Spacer(1, 0.2*inch))
+                story.append(Spacer(1, SECTION_GAP))
             
             # 9. Step-by-step text explanation
             story.append(Paragraph("Flow Description:", self.styles['CustomHeading2']))
@@ -3482,7 +3313,7 @@ class GitHubPDFService:
                         if len(match) > 2 and match not in ['the', 'and', 'with', 'for']:
                             attributes.append(match.lower())
         
-        return list(set(attributes))[:5]  # Limit to most relevant
+        return list(islice(dict.fromkeys(attributes), 5))  # Limit to most relevant
     
     def _infer_field_type(self, field_name: str) -> str:
         """Infer field type based on field name"""
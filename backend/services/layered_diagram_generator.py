@@ -2,10 +2,11 @@ import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 from matplotlib.patches import FancyBboxPatch, ConnectionPatch, Rectangle
 import os
-import time
 import re
 from typing import Dict, List, Any, Tuple
 
+from .diagram_generator import diagram_path, save_diagram
+
 class LayeredDataFlowGenerator:
     """Generate complex layered data flow diagrams dynamically from repository analysis"""
     
@@ -24,6 +25,9 @@ class LayeredDataFlowGenerator:
     
     def generate_layered_dataflow_diagram(self, repo_analysis: Dict, prd_analysis: Dict, endpoints: List[Dict]) -> str:
         """Generate comprehensive layered data flow diagram"""
+        filepath = diagram_path(self.output_dir, 'layered_dataflow', repo_analysis, prd_analysis, endpoints)
+        if os.path.exists(filepath):
+            return filepath
         
         # Detect all layers and components
         layers = self._detect_all_layers(repo_analysis, prd_analysis, endpoints)
@@ -70,10 +74,7 @@ class LayeredDataFlowGenerator:
         self._draw_data_flows(ax, layers)
         
         # Save
-        filename = f"layered_dataflow_{int(time.time())}.png"
-        filepath = os.path.join(self.output_dir, filename)
-        plt.savefig(filepath, dpi=300, bbox_inches='tight', facecolor='#fafafa', edgecolor='none')
-        plt.close()
+        save_diagram(filepath, facecolor='#fafafa')
         
         return filepath
     
@@ -0,0 +1,41 @@
+import os
+import subprocess
+import sys
+import unittest
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Report-key inputs shaped like the normalized repo/PRD analysis, including set-valued fields
+DIGEST_SCRIPT = """
+from services.content_keys import content_digest
+repo_analysis = {
+    'frontend_tech': ['React', 'Vite'],
+    'folder_structure': {'src': {'files': ['a.py', 'b.js'], 'file_types': {'.py', '.js', '.tsx', '.css'}}},
+    'tags': frozenset({'api', 'web', 'db', 'auth', 'cache'}),
+}
+prd_analysis = {'product_name': 'Clock', 'goals': {'fast', 'simple', 'secure', 'portable'}}
+print(content_digest('https://github.com/u/r', True, repo_analysis, prd_analysis, '2024-01-01'))
+"""
+
+
+def digest_with_hash_seed(seed: str) -> str:
+    env = dict(os.environ, PYTHONHASHSEED=seed)
+    result = subprocess.run([sys.executable, '-c', DIGEST_SCRIPT], cwd=BACKEND_DIR, env=env,
+                            capture_output=True, text=True, check=True)
+    return result.stdout.strip()
+
+
+class ContentDigestTest(unittest.TestCase):
+    def test_digest_is_stable_across_hash_seeds(self):
+        digests = {digest_with_hash_seed(seed) for seed in ('1', '2', '12345')}
+        self.assertEqual(len(digests), 1)
+
+    def test_set_order_does_not_change_digest(self):
+        sys.path.insert(0, BACKEND_DIR)
+        from services.content_keys import content_digest
+        self.assertEqual(content_digest({'b', 'a', 'c'}), content_digest({'c', 'b', 'a'}))
+        self.assertEqual(content_digest({'b', 'a'}), content_digest(['a', 'b']))
+
+
+if __name__ == '__main__':
+    unittest.main()